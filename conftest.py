@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+#make `node_3.executor` and node_1's flat modules importable under plain `pytest`
+ROOT = Path(__file__).resolve().parent
+for path in (ROOT, ROOT / 'node_1'):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
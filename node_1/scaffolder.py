@@ -1,15 +1,232 @@
 import os
 import json
 import ast
+import mmap
 import re
+import hashlib
+import logging
+import pickle
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional , TypedDict, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional , Tuple, TypedDict, Any
+from dataclasses import dataclass, field, replace
 import tree_sitter_python as tspython
 import tree_sitter_javascript as tsjavascript
 import tree_sitter_java as tsjava
 from tree_sitter import Language, Parser
 
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # optional - complexity falls back to the regex scan
+    np = None
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+#tree-sitter grammar modules per supported language
+_GRAMMARS = {
+    'python': tspython,
+    'javascript': tsjavascript,
+    'typescript': tsjavascript,
+    'java': tsjava
+}
+
+#AST node types that represent a function definition per language
+_FUNC_TYPES = {
+    'python': frozenset({'function_definition'}),
+    'javascript': frozenset({'function_declaration', 'method_definition', 'arrow_function'}),
+    'typescript': frozenset({'function_declaration', 'method_definition', 'arrow_function'}),
+    'java': frozenset({'method_declaration'})
+}
+
+#package name at the start of a requirements.txt line (skips comments and -r/-e options)
+_REQ_LINE_RE = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9_.\-]*)', re.M)
+
+#control-flow keywords counted by the complexity estimate
+_COMPLEXITY_RE = re.compile(rb'\b(?:if|elif|else|for|while|try|except|catch)\b')
+
+#function bodies at least this many bytes use the compiled keyword counter when numba is available
+_JIT_COMPLEXITY_THRESHOLD = 4096
+
+if njit is not None:
+    #_COMPLEXITY_RE keywords packed into one array, keyword k spans _KEYWORD_OFFSETS[k]:_KEYWORD_OFFSETS[k + 1]
+    _KEYWORDS = (b'if', b'elif', b'else', b'for', b'while', b'try', b'except', b'catch')
+    _KEYWORD_BYTES = np.frombuffer(b''.join(_KEYWORDS), dtype=np.uint8)
+    _KEYWORD_OFFSETS = np.cumsum(np.array([0] + [len(k) for k in _KEYWORDS], dtype=np.int64))
+
+    @njit(cache=True)
+    def _is_word_byte(c):
+        return (48 <= c <= 57) or (65 <= c <= 90) or (97 <= c <= 122) or c == 95
+
+    @njit(cache=True)
+    def _count_keywords(buf, keyword_bytes, keyword_offsets):
+        """Count whole-word keywords in a uint8 buffer, same result as len(_COMPLEXITY_RE.findall)"""
+        count = 0
+        n = buf.shape[0]
+        i = 0
+        while i < n:
+            if not _is_word_byte(buf[i]):
+                i += 1
+                continue
+            #a keyword only matches a complete word, so compare each word against the table
+            j = i
+            while j < n and _is_word_byte(buf[j]):
+                j += 1
+            for k in range(keyword_offsets.shape[0] - 1):
+                start = keyword_offsets[k]
+                length = keyword_offsets[k + 1] - start
+                if length == j - i:
+                    matched = True
+                    for m in range(length):
+                        if buf[i + m] != keyword_bytes[start + m]:
+                            matched = False
+                            break
+                    if matched:
+                        count += 1
+                        break
+            i = j
+        return count
+else:
+    _count_keywords = None
+
+#regex used when no tree-sitter grammar is available; each alternative captures one named group
+_FALLBACK_PATTERNS = {
+    'python': re.compile(rb'def\s+(?P<name>\w+)\s*\([^)]*\):', re.MULTILINE),
+    'javascript': re.compile(rb'function\s+(?P<name>\w+)\s*\([^)]*\)|(?P<arrow_name>\w+)\s*=\s*\([^)]*\)\s*=>', re.MULTILINE),
+    'java': re.compile(rb'(?:public|private|protected)?\s*(?:static)?\s*\w+\s+(?P<name>\w+)\s*\([^)]*\)', re.MULTILINE),
+}
+_DEFAULT_FALLBACK_PATTERN = re.compile(rb'(?P<name>\w+)\s*\([^)]*\)', re.MULTILINE)
+
+#AST node types holding a function's parameters, and parameters that carry a type or default
+#subtrees the function walk doesn't enter: definitions in an except block are fallbacks
+#(e.g. a stand-in for an optional import), not the code under test
+_SKIPPED_SUBTREE_TYPES = frozenset({'except_clause'})
+
+_PARAMETER_LIST_TYPES = frozenset({'parameters', 'parameter_list', 'formal_parameters'})
+_COMPLEX_PARAMETER_TYPES = frozenset({
+    'typed_parameter', 'default_parameter', 'typed_default_parameter',  # python
+    'assignment_pattern',  # javascript default value
+    'formal_parameter'  # java
+})
+
+#language-specific CodeAnalyzer helpers, resolved once per file so the walk never branches on language
+_RETURN_TYPE_GETTERS = {
+    'python': '_python_return_type',
+    'javascript': '_typescript_return_type',
+    'typescript': '_typescript_return_type',
+    'java': '_java_return_type'
+}
+_DOCSTRING_GETTERS = {
+    'python': '_python_docstring',
+    'javascript': '_jsdoc_docstring',
+    'typescript': '_jsdoc_docstring',
+    'java': '_javadoc_docstring'
+}
+
+_thread_parsers = threading.local()
+
+
+@lru_cache(maxsize=None)
+def _lang(name: str) -> Language:
+    """Return the process-wide Language object for a supported language"""
+    return Language(_GRAMMARS[name].language())
+
+
+def parser_for(language: str) -> Parser:
+    """Return this thread's parser for language, creating it on first use"""
+    parsers = getattr(_thread_parsers, 'parsers', None)
+    if parsers is None:
+        parsers = _thread_parsers.parsers = {}
+
+    parser = parsers.get(language)
+    if parser is None:
+        parser = Parser()
+        parser.language = _lang(language)
+        parsers[language] = parser
+    return parser
+
+
+#in-process LRU of extracted functions keyed like the on-disk cache
+_MEMORY_CACHE_SIZE = 256
+_memory_cache: "OrderedDict[str, FunctionTable]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+
+def _memory_cache_get(key: str) -> Optional['FunctionTable']:
+    with _memory_cache_lock:
+        functions = _memory_cache.get(key)
+        if functions is not None:
+            _memory_cache.move_to_end(key)
+        return functions
+
+
+def _memory_cache_put(key: str, functions: 'FunctionTable'):
+    with _memory_cache_lock:
+        _memory_cache[key] = functions
+        _memory_cache.move_to_end(key)
+        if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+#on-disk cache of extracted functions, shared across scaffolder runs
+_AST_CACHE_DB = Path('~/.autocover/ast_cache.sqlite').expanduser()
+#bump whenever the shape or content of extracted function info changes
+_AST_CACHE_VERSION = 11
+
+
+def _ast_cache_key(code_bytes: bytes, language: str) -> str:
+    return f"{_AST_CACHE_VERSION}:{hashlib.sha256(code_bytes).hexdigest()}:{language}"
+
+
+def _open_ast_cache() -> sqlite3.Connection:
+    _AST_CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(_AST_CACHE_DB)
+    conn.execute('CREATE TABLE IF NOT EXISTS ast_cache (key TEXT PRIMARY KEY, functions BLOB)')
+    return conn
+
+
+def _load_cached_functions(key: str) -> Optional['FunctionTable']:
+    """Return cached functions for key, or None on a miss"""
+    try:
+        with closing(_open_ast_cache()) as conn:
+            row = conn.execute('SELECT functions FROM ast_cache WHERE key=?', (key,)).fetchone()
+        return FunctionTable(**pickle.loads(row[0])) if row else None
+    except Exception as e:
+        logger.warning("Error reading AST cache: %s", e)
+        return None
+
+
+def _store_cached_functions(key: str, functions: 'FunctionTable'):
+    """Persist extracted functions under key"""
+    #store the plain columns so entries load no matter how this module was imported
+    try:
+        with closing(_open_ast_cache()) as conn, conn:
+            conn.execute('INSERT OR REPLACE INTO ast_cache (key, functions) VALUES (?, ?)',
+                         (key, pickle.dumps(vars(functions), protocol=pickle.HIGHEST_PROTOCOL)))
+    except Exception as e:
+        logger.warning("Error writing AST cache: %s", e)
+
+#below this size a plain read beats the cost of setting up a mapping
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def read_source_file(path) -> str:
+    """Read a UTF-8 source file, decoding large files straight from a memory map"""
+    path = Path(path)
+    if path.stat().st_size < _MMAP_MIN_SIZE:
+        return path.read_text(encoding='utf-8')
+    #decode from the mapped pages instead of reading into an intermediate bytes buffer
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return str(view, 'utf-8')
+
 class AutoCoverState(TypedDict):
     #input
     source_code : str
@@ -20,7 +237,7 @@ class AutoCoverState(TypedDict):
     test_framework: str
     existing_patterns: Dict[str, Any]
     dependencies: List[str]
-    target_functions: List[Dict[str, Any]]
+    target_functions: 'FunctionTable'
 
     #Later pipeline outputs
     generated_tests: Optional[str]
@@ -47,87 +264,173 @@ class ProjectConfig:
     dependencies: List[str]
     build_tool: Optional[str] = None
 
-class CodeAnalyzer:
-    """Analyzes source code to extract functions classes and structure"""
 
-    def __init__(self):
-        self.parsers = {
-            "python": self._setup_parser(Language(tspython.language())),
-            "javascript": self._setup_parser(Language(tsjavascript.language())),
-            "typescript": self._setup_parser(Language(tsjavascript.language())),
-            "java" : self._setup_parser(Language(tsjava.language()))
+#how much of a docstring is quoted back in generation prompts
+_DOC_PREVIEW_LENGTH = 200
+
+
+@dataclass
+class FunctionTable:
+    """Extracted functions stored column-wise, one entry per function in every column
+
+    Indexing or iterating yields the per-function dict shape
+    (name, parameters, return_type, docstring, doc_preview, code, start_line, end_line, complexity).
+    """
+    names: List[str] = field(default_factory=list)
+    params: List[List[Dict[str, Any]]] = field(default_factory=list)
+    return_types: List[Optional[str]] = field(default_factory=list)
+    docstrings: List[Optional[str]] = field(default_factory=list)
+    #docstring cut to _DOC_PREVIEW_LENGTH once here, so prompt builders don't re-slice every attempt
+    doc_previews: List[Optional[str]] = field(default_factory=list)
+    #function source stays as byte spans into the file, decoded only when a function's code is read
+    source: bytes = b''
+    code_starts: array = field(default_factory=lambda: array('i'))
+    code_ends: array = field(default_factory=lambda: array('i'))
+    start_lines: array = field(default_factory=lambda: array('i'))
+    end_lines: array = field(default_factory=lambda: array('i'))
+    complexities: array = field(default_factory=lambda: array('i'))
+
+    def append(self, name: str, parameters: List[Dict[str, Any]], return_type: Optional[str],
+               docstring: Optional[str], code_start: int, code_end: int, start_line: int, end_line: int,
+               complexity: int):
+        self.names.append(name)
+        self.params.append(parameters)
+        self.return_types.append(return_type)
+        self.docstrings.append(docstring)
+        self.doc_previews.append(docstring[:_DOC_PREVIEW_LENGTH] if docstring else None)
+        self.code_starts.append(code_start)
+        self.code_ends.append(code_end)
+        self.start_lines.append(start_line)
+        self.end_lines.append(end_line)
+        self.complexities.append(complexity)
+
+    def copy(self) -> 'FunctionTable':
+        return FunctionTable(
+            names=list(self.names),
+            #parameter lists and dicts are mutable too - copy them so callers can't edit the cached entry
+            params=[[dict(param) for param in params] for params in self.params],
+            return_types=list(self.return_types),
+            docstrings=list(self.docstrings),
+            doc_previews=list(self.doc_previews),
+            source=self.source,
+            code_starts=array('i', self.code_starts),
+            code_ends=array('i', self.code_ends),
+            start_lines=array('i', self.start_lines),
+            end_lines=array('i', self.end_lines),
+            complexities=array('i', self.complexities)
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return {
+            'name': self.names[index],
+            'parameters': self.params[index],
+            'return_type': self.return_types[index],
+            'docstring': self.docstrings[index],
+            'doc_preview': self.doc_previews[index],
+            'code': self.source[self.code_starts[index]:self.code_ends[index]].decode('utf-8', errors='replace'),
+            'start_line': self.start_lines[index],
+            'end_line': self.end_lines[index],
+            'complexity': self.complexities[index]
         }
 
-    def _setup_parser(self, language: Language) -> Parser:
-        parser = Parser()
-        parser.language = language  # Changed from parser.set_language(language)
-        return parser
-    
-    def extract_functions(self, code: str, language: str) -> List[Dict[str, Any]]:
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class CodeAnalyzer:
+    """Analyzes source code to extract functions classes and structure"""
+
+    def extract_functions(self, code: str, language: str) -> FunctionTable:
         """Extract function definitions from source code"""
-        if language not in self.parsers:
+        if language not in _GRAMMARS:
             return self._fallback_extract_functions(code, language)
         
-        parser = self.parsers[language]
-        tree = parser.parse(bytes(code, 'utf8'))
+        #tree-sitter reports byte offsets, so keep working on the encoded source
+        code_bytes = code.encode('utf-8')
+
+        #reuse functions extracted from identical source, in this process or an earlier run
+        cache_key = _ast_cache_key(code_bytes, language)
+        functions = _memory_cache_get(cache_key)
+        if functions is None:
+            functions = _load_cached_functions(cache_key)
+            if functions is None:
+                functions = self._parse_functions(code_bytes, language)
+                _store_cached_functions(cache_key, functions)
+            _memory_cache_put(cache_key, functions)
+
+        #cached entries are shared, hand out a fresh table
+        return functions.copy()
+
+    def _parse_functions(self, code_bytes: bytes, language: str) -> FunctionTable:
+        """Parse source with tree-sitter and collect function info"""
+        parser = parser_for(language)
+        tree = parser.parse(code_bytes)
+        #split once per file; split on b'\n' only so indexes line up with tree-sitter rows
+        lines = code_bytes.split(b'\n')
 
-        functions=[]
-        self._traverse_tree(tree.root_node, code, functions, language)
+        functions = FunctionTable(source=code_bytes)
+        self._traverse_tree(tree, code_bytes, lines, functions, language)
         return functions
     
-    def _traverse_tree(self, node, code: str, functions:List, language:str):
-        """Recursively traverse AST to find function definitions"""
-        if self._is_function_node(node, language):
-            func_info = self._extract_function_info(node, code, language)
-            if func_info:
-                functions.append(func_info)
-        
-        for child in node.children:
-            self._traverse_tree(child, code, functions, language)
-
-    def _is_function_node(self, node, language: str) -> bool:
-        """check if node represents a function definition"""
-        function_types = {
-            'python' : ['function_definition'],
-            'javascript' : ['function_declaration', 'method_definition', 'arrow_function'],
-            'typescript' : ['function_declaration', 'method_definition', 'arrow_function'],
-            'java' : ['method_declaration']
-        }
-        return node.type in function_types.get(language, [])
-    
-    def _extract_function_info(self, node, code:str, language: str) -> Optional[Dict[str, Any]]:
-        """Extract detailed information about a function"""
-        try:
-            start_byte = node.start_byte
-            end_byte = node.end_byte
-            function_code = code[start_byte:end_byte]
+    def _traverse_tree(self, tree, code_bytes: bytes, lines: List[bytes], functions: FunctionTable, language:str):
+        """Walk the AST with a tree cursor to find function definitions"""
+        allowed = _FUNC_TYPES.get(language, frozenset())
+        get_return_type = getattr(self, _RETURN_TYPE_GETTERS[language])
+        get_docstring = getattr(self, _DOCSTRING_GETTERS[language])
+        cursor = tree.walk()
+        while True:
+            node = cursor.node
+            if node.type in allowed:
+                self._append_function_info(functions, node, code_bytes, lines, language,
+                                           get_return_type, get_docstring)
 
-            #extract function name
-            name = self._get_function_name(node, language)
-            if not name:
-                return None
-            #Extract parameters
-            params = self._get_function_parameters(node, language)
+            if node.type not in _SKIPPED_SUBTREE_TYPES and cursor.goto_first_child():
+                continue
+            #no children - move to the next sibling, climbing up as needed
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return
 
-            #Extract return type hints (if available)
-            return_type = self._get_return_type(node, language)
+    def _append_function_info(self, table: FunctionTable, node, code_bytes: bytes, lines: List[bytes], language: str,
+                              get_return_type: Callable, get_docstring: Callable) -> bool:
+        """Extract detailed information about a function and append it to table"""
+        #extract function name - anonymous functions are skipped before any other work
+        name = self._get_function_name(node, language)
+        if not name:
+            return False
 
-            #Extract docstring/comments
-            docstring = self._get_docstring(node, code, language)
+        start_byte = node.start_byte
+        end_byte = node.end_byte
+        function_bytes = code_bytes[start_byte:end_byte]
 
-            return {
-                'name': name,
-                'parameters':params,
-                'return_type':return_type,
-                'docstring': docstring,
-                'code' : function_code,
-                'start_line' : node.start_point[0] + 1,
-                'end_line' : node.end_point[0] + 1,
-                'complexity' : self._estimate_complexity(function_code)
-            }
-        except Exception as e:
-            print(f"Error extracting function info: {e}")
-            return None
+        #Extract parameters
+        params = self._get_function_parameters(node, language)
+
+        #Extract return type hints (if available)
+        return_type = get_return_type(node)
+
+        #Extract docstring/comments
+        try:
+            docstring = get_docstring(node, lines)
+        except (IndexError, UnicodeDecodeError):
+            logger.debug("Could not extract docstring for %s", name, exc_info=True)
+            docstring = None
+
+        table.append(
+            name=name,
+            parameters=params,
+            return_type=return_type,
+            docstring=docstring,
+            code_start=start_byte,
+            code_end=end_byte,
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+            complexity=self._estimate_complexity(function_bytes)
+        )
+        return True
         
     def _get_function_name(self, node, language: str) -> Optional[str]:
         """Extract function name from AST node"""
@@ -141,30 +444,26 @@ class CodeAnalyzer:
         params = []
 
         #find parameter list node
-        param_node = None
-        for child in node.children:
-            if child.type == 'parameters' or child.type == 'parameter_list':
-                param_node = child
-                break
-            if not param_node:
-                return params
+        param_node = next((child for child in node.children if child.type in _PARAMETER_LIST_TYPES), None)
+        if param_node is None:
+            return params
             
-            #extract indvidual parameters
-            for child in param_node.children:
-                if child.type == 'identifier':
-                    #simple parameter
-                    params.append({
-                        'name': child.text.decode('utf8'),
-                        'type': None,
-                        'default':None,
-                        'required': True
-                    })
-
-                elif child.type == 'typed_parameter' or child.type == 'default_parameter':
-                    #parameter with type annotation or default value
-                    param_info = self._parse_complex_parameter(child, language)
-                    if param_info:
-                        params.append(param_info)
+        #extract indvidual parameters
+        for child in param_node.children:
+            if child.type == 'identifier':
+                #simple parameter
+                params.append({
+                    'name': child.text.decode('utf8'),
+                    'type': None,
+                    'default':None,
+                    'required': True
+                })
+
+            elif child.type in _COMPLEX_PARAMETER_TYPES:
+                #parameter with type annotation or default value
+                param_info = self._parse_complex_parameter(child, language)
+                if param_info:
+                    params.append(param_info)
 
         return params
     
@@ -174,13 +473,17 @@ class CodeAnalyzer:
         param_type = None
         default = None
 
+        after_equals = False
         for child in node.children:
-            if child.type == 'identifier' and not name:
+            if child.type == '=':
+                after_equals = True
+            elif after_equals:
+                #whatever follows '=' is the default, whatever kind of expression it is
+                default = child.text.decode('utf8')
+            elif child.type == 'identifier' and not name:
                 name = child.text.decode('utf8')
-            elif child.type == 'type' or 'type' in child.type:
+            elif 'type' in child.type:
                 param_type = child.text.decode('utf8')
-            elif 'default' in child.type or child.type in ['string', 'number', 'true', 'false', 'null']:
-                default = child.text.decode('utf8')
 
         if name:
             return {
@@ -191,82 +494,74 @@ class CodeAnalyzer:
             }
         return None
     
-    def _get_return_type(self, node, language: str) -> Optional[str]:
-        """Extract return type annotation"""
-        if language == 'python':
-            # Look for -> return_type annotation
-            for child in node.children:
-                if child.type == 'type':
-                    return child.text.decode('utf8')
-                # Check for -> arrow and following type
-                for i, subchild in enumerate(child.children):
-                    if subchild.text.decode('utf8') == '->' and i + 1 < len(child.children):
-                        return child.children[i + 1].text.decode('utf8')
-        
-        elif language in ['javascript', 'typescript']:
-            # Look for TypeScript return type annotations
-            for child in node.children:
-                if child.type == 'type_annotation':
-                    return child.text.decode('utf8').lstrip(':').strip()
-        
-        elif language == 'java':
-            # Java method return type is typically the first type before method name
-            for child in node.children:
-                if child.type in ['type_identifier', 'primitive_type', 'generic_type']:
-                    return child.text.decode('utf8')
-        
+    def _python_return_type(self, node) -> Optional[str]:
+        # Look for -> return_type annotation
+        for child in node.children:
+            if child.type == 'type':
+                return child.text.decode('utf8')
+            # Check for -> arrow and following type
+            for i, subchild in enumerate(child.children):
+                if subchild.text.decode('utf8') == '->' and i + 1 < len(child.children):
+                    return child.children[i + 1].text.decode('utf8')
+        return None
+
+    def _typescript_return_type(self, node) -> Optional[str]:
+        # Look for TypeScript return type annotations
+        for child in node.children:
+            if child.type == 'type_annotation':
+                return child.text.decode('utf8').lstrip(':').strip()
+        return None
+
+    def _java_return_type(self, node) -> Optional[str]:
+        # Java method return type is typically the first type before method name
+        for child in node.children:
+            if child.type in ['type_identifier', 'primitive_type', 'generic_type']:
+                return child.text.decode('utf8')
         return None
     
-    def _get_docstring(self, node, code: str, language: str) -> Optional[str]:
-        """Extract function docstring or comments"""
-        if language == 'python':
-            # Look for string literal as first statement in function body
-            for child in node.children:
-                if child.type == 'block':
-                    for stmt in child.children:
-                        if stmt.type == 'expression_statement':
-                            for expr in stmt.children:
-                                if expr.type == 'string':
-                                    # Remove quotes and clean up
-                                    docstring = expr.text.decode('utf8')
-                                    return self._clean_docstring(docstring)
-        
-        elif language in ['javascript', 'typescript']:
-            # Look for JSDoc comments before function
-            start_line = node.start_point[0]
-            lines = code.split('\n')
-            
-            # Check lines before function for /** */ comments
-            for i in range(max(0, start_line - 10), start_line):
-                line = lines[i].strip()
-                if line.startswith('/**'):
-                    # Extract JSDoc comment
-                    comment_lines = []
-                    for j in range(i, min(len(lines), start_line)):
-                        comment_line = lines[j].strip()
-                        if comment_line.startswith('*'):
-                            comment_lines.append(comment_line.lstrip('*').strip())
-                        if comment_line.endswith('*/'):
-                            break
-                    return '\n'.join(comment_lines) if comment_lines else None
-        
-        elif language == 'java':
-            # Look for Javadoc comments
-            start_line = node.start_point[0]
-            lines = code.split('\n')
-            
-            for i in range(max(0, start_line - 10), start_line):
-                line = lines[i].strip()
-                if line.startswith('/**'):
-                    comment_lines = []
-                    for j in range(i, min(len(lines), start_line)):
-                        comment_line = lines[j].strip()
-                        if comment_line.startswith('*') and not comment_line.startswith('/**'):
-                            comment_lines.append(comment_line.lstrip('*').strip())
-                        if comment_line.endswith('*/'):
-                            break
-                    return '\n'.join(comment_lines) if comment_lines else None
+    def _python_docstring(self, node, lines: List[bytes]) -> Optional[str]:
+        # Look for string literal as first statement in function body (comments are not statements)
+        body = node.child_by_field_name('body')
+        if body is None:
+            return None
+        first = next((stmt for stmt in body.named_children if stmt.type != 'comment'), None)
+        if first is not None and first.type == 'expression_statement' and first.named_child_count:
+            expr = first.named_children[0]
+            if expr.type == 'string':
+                # Remove quotes and clean up
+                return self._clean_docstring(expr.text.decode('utf8'))
+        return None
+
+    def _jsdoc_docstring(self, node, lines: List[bytes]) -> Optional[str]:
+        # Look for JSDoc comments before function
+        return self._doc_comment_before(node, lines)
+
+    def _javadoc_docstring(self, node, lines: List[bytes]) -> Optional[str]:
+        # Look for Javadoc comments
+        return self._doc_comment_before(node, lines)
+
+    def _doc_comment_before(self, node, lines: List[bytes]) -> Optional[str]:
+        """Text of the /** ... */ comment directly above node, without its comment markers"""
+        #step over blank lines and annotations (e.g. @Override) between the comment and the function
+        end = node.start_point[0] - 1
+        while end >= 0 and (not lines[end].strip() or lines[end].strip().startswith(b'@')):
+            end -= 1
+        if end < 0 or not lines[end].strip().endswith(b'*/'):
+            return None
         
+        #look up to 10 lines back for where that comment opens
+        for i in range(end, max(-1, end - 10), -1):
+            if lines[i].strip().startswith(b'/**'):
+                comment_lines = []
+                for comment_line in lines[i:end + 1]:
+                    #the opening and closing lines can carry text too, as in a one-line /** ... */
+                    text = comment_line.strip().removeprefix(b'/**').removesuffix(b'*/').lstrip(b'*').strip()
+                    if text:
+                        comment_lines.append(text.decode('utf-8'))
+                return '\n'.join(comment_lines) if comment_lines else None
+            if lines[i].strip().startswith(b'/*'):
+                #a plain block comment, not a doc comment
+                return None
         return None
     
     def _clean_docstring(self, docstring: str) -> str:
@@ -284,43 +579,80 @@ class CodeAnalyzer:
         # Clean up whitespace
         return docstring.strip()
     
-    def _estimate_complexity(self, code: str) -> int:
+    def _estimate_complexity(self, code: bytes) -> int:
         """Simple complexity estimation based on control structures"""
-        complexity = 1  # Base complexity
-        control_keywords = ['if', 'elif', 'else', 'for', 'while', 'try', 'except', 'catch']
-        for keyword in control_keywords:
-            complexity += code.count(keyword)
-        return complexity
+        # Base complexity plus one per keyword
+        if _count_keywords is not None and len(code) >= _JIT_COMPLEXITY_THRESHOLD:
+            return 1 + _count_keywords(np.frombuffer(code, dtype=np.uint8), _KEYWORD_BYTES, _KEYWORD_OFFSETS)
+        return 1 + len(_COMPLEXITY_RE.findall(code))
     
-    def _fallback_extract_functions(self, code: str, language: str) -> List[Dict[str, Any]]:
+    def _fallback_extract_functions(self, code: str, language: str) -> FunctionTable:
         """Fallback function extraction using regex"""
-        patterns = {
-            'python': r'def\s+(\w+)\s*\([^)]*\):',
-            'javascript': r'function\s+(\w+)\s*\([^)]*\)|(\w+)\s*=\s*\([^)]*\)\s*=>',
-            'java': r'(public|private|protected)?\s*(static)?\s*\w+\s+(\w+)\s*\([^)]*\)',
-        }
-        
-        pattern = patterns.get(language, r'(\w+)\s*\([^)]*\)')
-        matches = re.findall(pattern, code, re.MULTILINE)
+        pattern = _FALLBACK_PATTERNS.get(language, _DEFAULT_FALLBACK_PATTERN)
         
-        functions = []
-        for match in matches:
-            name = match if isinstance(match, str) else next(filter(None, match), '')
+        functions = FunctionTable()
+        for match in pattern.finditer(code.encode('utf-8')):
+            #lastgroup is the named group of whichever alternative matched
+            name = match[match.lastgroup]
             if name:
-                functions.append({
-                    'name': name,
-                    'parameters': [],
-                    'return_type': None,
-                    'docstring': None,
-                    'code': '',
-                    'start_line': 0,
-                    'end_line': 0,
-                    'complexity': 1
-                })
+                functions.append(
+                    name=name.decode('utf-8'),
+                    parameters=[],
+                    return_type=None,
+                    docstring=None,
+                    code_start=0,
+                    code_end=0,
+                    start_line=0,
+                    end_line=0,
+                    complexity=1
+                )
         
         return functions
     
 
+#files whose presence marks a directory as a project root
+_PROJECT_INDICATORS = frozenset([
+    'package.json',      # Node.js
+    'requirements.txt',  # Python
+    'pyproject.toml',    # Python
+    'setup.py',          # Python
+    'pom.xml',           # Java Maven
+    'build.gradle',      # Java Gradle
+    'go.mod',            # Go
+    'Cargo.toml',        # Rust
+    '.git',              # Git repository
+])
+
+#project configs already analyzed, keyed like _find_project_root_cached
+_project_configs: Dict[tuple, ProjectConfig] = {}
+
+
+def _cwd_key(path: Path) -> Optional[str]:
+    """Relative paths depend on the working directory, so it becomes part of cache keys"""
+    return None if path.is_absolute() else os.getcwd()
+
+
+def _has_project_indicator(directory: Path) -> bool:
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name in _PROJECT_INDICATORS for entry in entries)
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=256)
+def _find_project_root_cached(file_path: Path, cwd: Optional[str]) -> Path:
+    current = file_path.parent if file_path.is_file() else file_path
+
+    #one directory listing per level instead of an exists() probe per indicator
+    while current != current.parent:
+        if _has_project_indicator(current):
+            return current
+        current = current.parent
+
+    return file_path.parent
+
+
 class ProjectScaffolder:
     """Main scaffolder that analyzes project structure and prepare test context"""
 
@@ -335,14 +667,15 @@ class ProjectScaffolder:
         project_root = self._find_project_root(file_path)
         project_config = self._analyze_project_structure(project_root)
 
-        #step2: Analyze existing test patterns
-        existing_patterns = self._analyze_existing_tests(project_root, project_config)
+        #step2: Analyze existing test patterns (one scan of the test directory)
+        test_files, has_existing_tests = self._scan_test_dir(project_root / project_config.test_directory)
+        existing_patterns = self._analyze_existing_tests(test_files, project_config)
 
         #step 3: Extract target functions from source code
         target_functions = self._analyze_source_code(state['source_code'], project_config.language)
 
         #step 4: Build comprehensive project context
-        project_context = self._build_project_context(project_root, project_config, file_path)
+        project_context = self._build_project_context(project_root, project_config, file_path, has_existing_tests)
 
         #Update state with scaffolder results
         state.update({
@@ -362,33 +695,20 @@ class ProjectScaffolder:
     
     def _find_project_root(self, file_path: Path) -> Path:
         """Find project root by looking for config files"""
-        current = file_path.parent if file_path.is_file() else file_path
-
-        #look for common project indicators
-        indicators = [
-            'package.json',      # Node.js
-            'requirements.txt',  # Python
-            'pyproject.toml',    # Python
-            'setup.py',          # Python
-            'pom.xml',           # Java Maven
-            'build.gradle',      # Java Gradle
-            'go.mod',            # Go
-            'Cargo.toml',        # Rust
-            '.git',              # Git repository
-        ]
-
-        while current != current.parent:
-            for indicator in indicators:
-                if (current / indicator).exists():
-                    return current
-            current = current.parent
-
-        return file_path.parent
+        return _find_project_root_cached(file_path, _cwd_key(file_path))
     
     def _analyze_project_structure(self, project_root: Path) -> ProjectConfig:
         """Analyze project to determine language, framework and structure"""
+        key = (project_root, _cwd_key(project_root))
+        config = _project_configs.get(key)
+        if config is None:
+            config = _project_configs[key] = self._detect_project_config(project_root)
+
+        #callers get their own dependency list so the cached config stays intact
+        return replace(config, dependencies=list(config.dependencies))
 
-        #detect language and framework
+    def _detect_project_config(self, project_root: Path) -> ProjectConfig:
+        """Detect language and framework from the files in project_root"""
         if (project_root / 'package.json').exists():
             return self._analyze_node_project(project_root)
         elif (project_root / 'requirements.txt').exists() or (project_root / 'pyproject.toml').exists():
@@ -427,7 +747,7 @@ class ProjectScaffolder:
                     test_framework = 'vitest'
 
             except Exception as e:
-                print(f"Error reading package.json: {e}")
+                logger.warning("Error reading package.json: %s", e)
 
         return ProjectConfig(
             language='javascript',
@@ -447,15 +767,14 @@ class ProjectScaffolder:
         req_file = project_root / 'requirements.txt'
         if req_file.exists():
             try:
-                with open(req_file, 'r') as f:
-                    dependencies = [line.strip().split('==')[0] for line in f if line.strip() and not line.startswith('#')]
+                #package names in file order, without version specifiers or duplicates
+                names = (m.group(1) for m in _REQ_LINE_RE.finditer(req_file.read_text()))
+                dependencies = list(dict.fromkeys(names))
             except Exception as e:
-                print(f"Error reading requirements.txt: {e}")
+                logger.warning("Error reading requirements.txt: %s", e)
         
         # Detect test framework
-        test_framework = 'pytest'
-        if 'unittest' in dependencies or any('unittest' in dep for dep in dependencies):
-            test_framework = 'unittest'
+        test_framework = 'unittest' if 'unittest' in dependencies else 'pytest'
         
         return ProjectConfig(
             language='python',
@@ -503,11 +822,34 @@ class ProjectScaffolder:
             build_tool=None
         )
     
-    def _analyze_existing_tests(self, project_root: Path, config: ProjectConfig) -> Dict[str, Any]:
+    def _scan_test_dir(self, test_dir: Path) -> Tuple[Optional[List[Path]], bool]:
+        """Walk the test directory once
+
+        Returns the entries whose name contains 'test' (None if the directory
+        does not exist) and whether the directory has any entries at all.
+        """
+        try:
+            top_entries = list(os.scandir(test_dir))
+        except OSError:
+            return None, False
+
+        test_files = []
+        pending = [top_entries]
+        while pending:
+            for entry in pending.pop():
+                if 'test' in entry.name:
+                    test_files.append(Path(entry.path))
+                if entry.is_dir(follow_symlinks=False):
+                    try:
+                        pending.append(list(os.scandir(entry.path)))
+                    except OSError:
+                        pass
+
+        return test_files, bool(top_entries)
+
+    def _analyze_existing_tests(self, test_files: Optional[List[Path]], config: ProjectConfig) -> Dict[str, Any]:
         """Analyze existing test files to understand patterns and conventions"""
-        test_dir = project_root / config.test_directory
-        
-        if not test_dir.exists():
+        if test_files is None:
             return {
                 'test_count': 0,
                 'naming_patterns': [],
@@ -516,7 +858,6 @@ class ProjectScaffolder:
                 'mocking_patterns': []
             }
         
-        test_files = list(test_dir.rglob('*test*'))
         patterns = {
             'test_count': len(test_files),
             'naming_patterns': self._extract_naming_patterns(test_files),
@@ -553,11 +894,12 @@ class ProjectScaffolder:
         """Extract mocking and stubbing patterns from existing tests"""
         return []
     
-    def _analyze_source_code(self, source_code: str, language: str) -> List[Dict[str, Any]]:
+    def _analyze_source_code(self, source_code: str, language: str) -> FunctionTable:
         """Analyze the source code to extract functions that need testing"""
         return self.code_analyzer.extract_functions(source_code, language)
     
-    def _build_project_context(self, project_root: Path, config: ProjectConfig, target_file: Path) -> Dict[str, Any]:
+    def _build_project_context(self, project_root: Path, config: ProjectConfig, target_file: Path,
+                               has_existing_tests: bool) -> Dict[str, Any]:
         """Build comprehensive project context for test generation"""
         return {
             'project_root': str(project_root),
@@ -569,7 +911,7 @@ class ProjectScaffolder:
             'target_file': str(target_file),
             'relative_path': str(target_file.relative_to(project_root)),
             'dependencies': config.dependencies,
-            'has_existing_tests': len(list(Path(project_root / config.test_directory).glob('*'))) > 0 if Path(project_root / config.test_directory).exists() else False
+            'has_existing_tests': has_existing_tests
         }
 
 
@@ -579,6 +921,18 @@ def scaffolder_node(state: AutoCoverState) -> AutoCoverState:
     return scaffolder.scaffold_project(state)
 
 
+def scaffold_batch(states: List[AutoCoverState], max_workers: Optional[int] = None,
+                   threads: bool = False) -> List[AutoCoverState]:
+    """Scaffold several source files in parallel, results in the same order as states
+
+    Uses worker processes by default since AST traversal is pure Python and holds
+    the GIL; threads=True is cheaper to start for small batches.
+    """
+    executor_cls = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    with executor_cls(max_workers=max_workers) as executor:
+        return list(executor.map(scaffolder_node, states))
+
+
 # Example usage and testing
 def create_sample_project():
     """Create a sample project structure in memory for testing"""
@@ -649,7 +1003,7 @@ if __name__ == "__main__":
         
         # Read actual source code
         # source_code = target_file.read_text()
-        source_code = Path("test_script.py").read_text()
+        source_code = read_source_file("test_script.py")
         target_file = "test_script.py"
         
         # Test with real file structure
@@ -1,3 +1,15 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional - the functions below then run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+    prange = range
+
+
+@njit("Tuple((float64, float64))(float64, float64)", cache=True)
 def calculate_discount(price: float, discount_percent: int) -> tuple:
     '''Calculate discount amount and final price
     
@@ -21,55 +33,164 @@ def calculate_discount(price: float, discount_percent: int) -> tuple:
     return final_price, discount_amount
 
 
+@njit(parallel=True, cache=True)
+def calculate_discount_array(prices, discount_percents):
+    '''Vectorized calculate_discount over equal-length arrays
+    
+    Returns:
+        tuple: (final_prices, discount_amounts) as float64 arrays
+    '''
+    n = prices.shape[0]
+    # validate serially - exceptions can't be raised from inside a parallel loop
+    for i in range(n):
+        if prices[i] < 0:
+            raise ValueError("Price cannot be negative")
+        if discount_percents[i] < 0 or discount_percents[i] > 100:
+            raise ValueError("Discount percent must be between 0 and 100")
+    
+    final_prices = np.empty(n, dtype=np.float64)
+    discount_amounts = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        discount_amount = prices[i] * (discount_percents[i] / 100)
+        final_prices[i] = prices[i] - discount_amount
+        discount_amounts[i] = discount_amount
+    return final_prices, discount_amounts
+
+
+# multiplier per tier: none, 5+ items (5% off), 10+ items (10% off)
+_BULK_MULTIPLIERS = np.array([1.0, 0.95, 0.9])
+
+
+@njit(cache=True)
 def apply_bulk_discount(total_amount: float, item_count: int = 1) -> float:
     '''Apply bulk discount based on item count'''
-    if item_count >= 10:
-        return total_amount * 0.9  # 10% discount
-    elif item_count >= 5:
-        return total_amount * 0.95  # 5% discount
-    return total_amount
+    # the tier is the number of thresholds reached - a table lookup instead of branches
+    tier = (item_count >= 5) + (item_count >= 10)
+    return total_amount * _BULK_MULTIPLIERS[tier]
+
+
+def apply_bulk_discount_array(total_amounts, item_counts):
+    '''Vectorized apply_bulk_discount over equal-length arrays'''
+    item_counts = np.asarray(item_counts)
+    tiers = (item_counts >= 5).astype(np.intp) + (item_counts >= 10)
+    return np.asarray(total_amounts, dtype=np.float64) * _BULK_MULTIPLIERS[tiers]
 
 
 class ShoppingCart:
     '''Shopping cart to manage items and calculate totals'''
     
+    _INITIAL_CAPACITY = 16
+    
     def __init__(self):
-        self.items = []
+        # entries stored column-wise; slots [0, _n) are in use
+        self._names = [None] * self._INITIAL_CAPACITY
+        # prices are held as integer cents so totals are exact
+        self._prices = np.empty(self._INITIAL_CAPACITY, dtype=np.int64)
+        self._quantities = np.empty(self._INITIAL_CAPACITY, dtype=np.int64)
+        self._n = 0
+        # item name -> slots holding entries with that name, oldest first
+        self._positions = {}
         self.tax_rate = 0.08
+        # kept in step with the entries so totals don't re-walk the cart
+        self._subtotal_cents = 0
+    
+    @property
+    def tax_rate(self) -> float:
+        return self._tax_bp / 10000
+    
+    @tax_rate.setter
+    def tax_rate(self, rate: float):
+        # stored in basis points so tax is integer arithmetic on cents
+        self._tax_bp = int(round(rate * 10000))
+    
+    @property
+    def items(self) -> dict:
+        '''Item name -> entries added under that name, oldest first'''
+        return {
+            name: [{'item': name, 'price': int(self._prices[i]) / 100, 'quantity': int(self._quantities[i])}
+                   for i in slots]
+            for name, slots in self._positions.items()
+        }
     
     def add_item(self, item: str, price: float, quantity: int = 1):
         '''Add an item to the cart'''
         if price < 0:
             raise ValueError("Price cannot be negative")
+        if quantity != int(quantity):
+            raise ValueError("Quantity must be a whole number")
+        quantity = int(quantity)
         if quantity < 1:
             raise ValueError("Quantity must be at least 1")
-            
-        self.items.append({
-            'item': item,
-            'price': price,
-            'quantity': quantity
-        })
+        
+        if self._n == len(self._names):
+            self._grow()
+        slot = self._n
+        self._names[slot] = item
+        price_cents = int(round(price * 100))
+        self._prices[slot] = price_cents
+        self._quantities[slot] = quantity
+        self._n += 1
+        self._positions.setdefault(item, []).append(slot)
+        self._subtotal_cents += price_cents * quantity
+    
+    def _grow(self):
+        capacity = 2 * len(self._names)
+        self._names.extend([None] * (capacity - len(self._names)))
+        self._prices = np.resize(self._prices, capacity)
+        self._quantities = np.resize(self._quantities, capacity)
     
     def remove_item(self, item: str) -> bool:
         '''Remove an item from the cart'''
-        for i, cart_item in enumerate(self.items):
-            if cart_item['item'] == item:
-                self.items.pop(i)
-                return True
-        return False
+        slots = self._positions.get(item)
+        if not slots:
+            return False
+        slot = slots.pop(0)
+        if not slots:
+            del self._positions[item]
+        self._subtotal_cents -= int(self._prices[slot]) * int(self._quantities[slot])
+        
+        # swap-pop: move the last entry into the freed slot instead of shifting
+        last = self._n - 1
+        if slot != last:
+            moved = self._names[last]
+            self._names[slot] = moved
+            self._prices[slot] = self._prices[last]
+            self._quantities[slot] = self._quantities[last]
+            moved_slots = self._positions[moved]
+            moved_slots[moved_slots.index(last)] = slot
+        self._names[last] = None
+        self._n = last
+        return True
+    
+    def get_subtotal_cents(self) -> int:
+        '''Calculate subtotal before tax, in cents'''
+        return self._subtotal_cents
+    
+    def get_tax_amount_cents(self) -> int:
+        '''Calculate tax amount in cents, rounded down to a whole cent'''
+        return self._subtotal_cents * self._tax_bp // 10000
+    
+    def get_total_cents(self) -> int:
+        '''Calculate total including tax, in cents'''
+        return self._subtotal_cents + self.get_tax_amount_cents()
     
     def get_subtotal(self) -> float:
         '''Calculate subtotal before tax'''
-        return sum(item['price'] * item['quantity'] for item in self.items)
+        return self._subtotal_cents / 100
     
     def get_tax_amount(self) -> float:
         '''Calculate tax amount'''
-        return self.get_subtotal() * self.tax_rate
+        return self.get_tax_amount_cents() / 100
     
     def get_total(self) -> float:
         '''Calculate total including tax'''
-        return self.get_subtotal() + self.get_tax_amount()
+        return self.get_total_cents() / 100
     
     def clear_cart(self):
         '''Empty the shopping cart'''
-        self.items = []
\ No newline at end of file
+        self._names = [None] * self._INITIAL_CAPACITY
+        self._prices = np.empty(self._INITIAL_CAPACITY, dtype=np.int64)
+        self._quantities = np.empty(self._INITIAL_CAPACITY, dtype=np.int64)
+        self._n = 0
+        self._positions = {}
+        self._subtotal_cents = 0
\ No newline at end of file
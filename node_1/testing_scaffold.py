@@ -1,13 +1,16 @@
 import os
+import logging
 import tempfile
 import shutil
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 
 # Test function you can use
 def test_scaffolder_with_real_files():
     """Test scaffolder with real file structure"""
-    from scaffolder import scaffolder_node, AutoCoverState
+    from scaffolder import scaffolder_node, AutoCoverState, read_source_file
     
     # Setup test project
     # project_dir = setup_test_project()
@@ -16,7 +19,7 @@ def test_scaffolder_with_real_files():
     
     try:
         # Read the actual source code
-        source_code = target_file.read_text()
+        source_code = read_source_file(target_file)
         
         # Create state with real file path
         test_state = AutoCoverState(
@@ -38,48 +41,50 @@ def test_scaffolder_with_real_files():
         result = scaffolder_node(test_state)
         # print(f"The result is \n: {result}")
         
-        # Print results
-        print("=" * 50)
-        print("SCAFFOLDER RESULTS")
-        print("=" * 50)
-        print(f"Project Root: {result['project_context']['project_root']}")
-        print(f"Language: {result['project_context']['language']}")
-        print(f"Test Framework: {result['test_framework']}")
-        print(f"Build Tool: {result['project_context']['build_tool']}")
-        print(f" the depedence is {result['dependencies']}")
-        print(f"Dependencies: {len(result['dependencies'])} found")
-        print(f"Has Existing Tests: {result['project_context']['has_existing_tests']}")
-        print(f"Target Functions: {len(result['target_functions'])}")
+        # Log results - arguments are only formatted when the level is enabled
+        logger.info("=" * 50)
+        logger.info("SCAFFOLDER RESULTS")
+        logger.info("=" * 50)
+        logger.info("Project Root: %s", result['project_context']['project_root'])
+        logger.info("Language: %s", result['project_context']['language'])
+        logger.info("Test Framework: %s", result['test_framework'])
+        logger.info("Build Tool: %s", result['project_context']['build_tool'])
+        logger.info(" the depedence is %s", result['dependencies'])
+        logger.info("Dependencies: %d found", len(result['dependencies']))
+        logger.info("Has Existing Tests: %s", result['project_context']['has_existing_tests'])
+        logger.info("Target Functions: %d", len(result['target_functions']))
         
-        print("\nFUNCTIONS DETECTED:")
-        for func in result['target_functions']:
-            print(f"  📝 {func['name']}")
-            print(f"     Parameters: {[p['name'] for p in func['parameters']]}")
-            print(f"     Return Type: {func['return_type']}")
-            print(f"     Complexity: {func['complexity']}")
-            print(f"     Has Docstring: {'Yes' if func['docstring'] else 'No'}")
-            # print(f"     Code: {func['code']}")
-            if func['docstring']:
-                print(f"     Doc: {func['docstring'][:100]}...")
-            print()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\nFUNCTIONS DETECTED:")
+            for func in result['target_functions']:
+                logger.debug("  📝 %s", func['name'])
+                logger.debug("     Parameters: %s", [p['name'] for p in func['parameters']])
+                logger.debug("     Return Type: %s", func['return_type'])
+                logger.debug("     Complexity: %s", func['complexity'])
+                logger.debug("     Has Docstring: %s", 'Yes' if func['docstring'] else 'No')
+                # logger.debug("     Code: %s", func['code'])
+                if func['docstring']:
+                    logger.debug("     Doc: %s...", func['docstring'][:100])
+                logger.debug("")
         
-        print("\nEXISTING TEST PATTERNS:")
+        logger.info("\nEXISTING TEST PATTERNS:")
         patterns = result['existing_patterns']
-        print(f"  Existing test files: {patterns['test_count']}")
-        print(f"  Naming patterns: {patterns['naming_patterns']}")
+        logger.info("  Existing test files: %s", patterns['test_count'])
+        logger.info("  Naming patterns: %s", patterns['naming_patterns'])
         
-        print("\nPROJECT CONTEXT:")
+        logger.info("\nPROJECT CONTEXT:")
         context = result['project_context']
-        print(f"context is: {context}")
-        print(f"  Source dir: {context['source_directory']}")
-        print(f"  Test dir: {context['test_directory']}")
-        print(f"  Target file: {context['relative_path']}")
+        logger.info("context is: %s", context)
+        logger.info("  Source dir: %s", context['source_directory'])
+        logger.info("  Test dir: %s", context['test_directory'])
+        logger.info("  Target file: %s", context['relative_path'])
         
         return result
         
     except Exception as e:
-        print(f"Cannot generate Information: {e}")
+        logger.error("Cannot generate Information: %s", e)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     test_scaffolder_with_real_files()
\ No newline at end of file
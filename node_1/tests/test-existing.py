@@ -1,5 +1,6 @@
 import pytest
-from test_script import calculate_discount
+import scaffolder
+from test_script import ShoppingCart, calculate_discount
 
 
 def test_calculate_discount_basic():
@@ -11,4 +12,141 @@ def test_calculate_discount_basic():
 def test_calculate_discount_zero():
     '''Test zero discount'''
     result = calculate_discount(50.0, 0)
-    assert result == (50.0, 0.0)
\ No newline at end of file
+    assert result == (50.0, 0.0)
+
+
+def test_add_item_rejects_fractional_quantity():
+    '''Fractional quantities are rejected instead of truncated in the cart but not the subtotal'''
+    cart = ShoppingCart()
+    with pytest.raises(ValueError):
+        cart.add_item('apple', 1.0, 2.5)
+    assert cart.get_subtotal() == 0
+    
+    cart.add_item('apple', 1.0, 2.0)
+    assert cart.remove_item('apple')
+    assert cart.get_subtotal() == 0
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    '''CodeAnalyzer with an empty, throwaway AST cache'''
+    monkeypatch.setattr(scaffolder, '_AST_CACHE_DB', tmp_path / 'ast_cache.sqlite')
+    monkeypatch.setattr(scaffolder, '_memory_cache', type(scaffolder._memory_cache)())
+    return scaffolder.CodeAnalyzer()
+
+
+def test_extract_functions_returns_independent_copies(analyzer):
+    '''Editing a returned table doesn't leak into later cached results'''
+    code = "def add(a, b):\n    return a + b\n"
+    functions = analyzer.extract_functions(code, 'python')
+    functions[0]['parameters'].append({'name': 'INJECTED'})
+    functions[0]['parameters'][0]['name'] = 'changed'
+    
+    again = analyzer.extract_functions(code, 'python')
+    assert [param['name'] for param in again[0]['parameters']] == ['a', 'b']
+
+
+def _parameters(function):
+    return [(param['name'], param['type'], param['default']) for param in function['parameters']]
+
+
+def test_python_parameters(analyzer):
+    '''Parameter names, annotations and defaults of a Python function'''
+    code = "def add(a: int, b=2, c: float = 3.5):\n    return a + b + c\n"
+    function = analyzer.extract_functions(code, 'python')[0]
+    assert _parameters(function) == [('a', 'int', None), ('b', None, '2'), ('c', 'float', '3.5')]
+    assert [param['required'] for param in function['parameters']] == [True, False, False]
+
+
+def test_javascript_parameters(analyzer):
+    '''Parameter names and defaults of a JavaScript function'''
+    code = "function add(a, b = 1) {\n  return a + b;\n}\n"
+    function = analyzer.extract_functions(code, 'javascript')[0]
+    assert _parameters(function) == [('a', None, None), ('b', None, '1')]
+
+
+def test_java_parameters(analyzer):
+    '''Parameter names and types of a Java method'''
+    code = "class A {\n    int add(int a, String b) { return a; }\n}\n"
+    function = analyzer.extract_functions(code, 'java')[0]
+    assert _parameters(function) == [('a', 'int', None), ('b', 'String', None)]
+
+
+def test_function_code_after_non_ascii_source(analyzer):
+    '''Function bodies are sliced by byte offset, so non-ASCII text earlier in the file doesn't shift them'''
+    code = 'def greet(name):\n    return "héllo, ünïcode " + name\n\n\ndef after():\n    return "ok"\n'
+    greet, after = analyzer.extract_functions(code, 'python')
+    assert greet['code'] == 'def greet(name):\n    return "héllo, ünïcode " + name'
+    assert after['code'] == 'def after():\n    return "ok"'
+    assert (after['start_line'], after['end_line']) == (5, 6)
+
+
+def test_java_fallback_names_methods_not_modifiers(analyzer):
+    '''The regex fallback reports the method name, not its access modifier'''
+    code = 'public class A {\n    public static int add(int a, int b) { return a + b; }\n    private void reset() {}\n}\n'
+    functions = analyzer._fallback_extract_functions(code, 'java')
+    assert [function['name'] for function in functions] == ['add', 'reset']
+
+
+def test_python_docstring_is_first_statement_only(analyzer):
+    '''Only a string that is the first statement of the body counts as the docstring'''
+    code = ('def documented():\n    # a comment first is fine\n    """Return one"""\n    return 1\n\n\n'
+            'def undocumented():\n    value = 1\n    "not a docstring"\n    return value\n')
+    documented, undocumented = analyzer.extract_functions(code, 'python')
+    assert documented['docstring'] == 'Return one'
+    assert undocumented['docstring'] is None
+
+
+def test_jsdoc_docstring(analyzer):
+    '''JSDoc comment lines before a JavaScript function become its docstring'''
+    code = '/**\n * Add two numbers\n */\nfunction add(a, b) {\n  return a + b;\n}\n'
+    assert analyzer.extract_functions(code, 'javascript')[0]['docstring'] == 'Add two numbers'
+
+
+def test_javadoc_docstring(analyzer):
+    '''Javadoc before a method becomes its docstring, one-line comments included'''
+    code = ('class A {\n    /**\n     * Add two numbers\n     * @return the sum\n     */\n'
+            '    int add(int a, int b) { return a + b; }\n\n    /** Reset state */\n    void reset() {}\n}\n')
+    add, reset = analyzer.extract_functions(code, 'java')
+    assert add['docstring'] == 'Add two numbers\n@return the sum'
+    assert reset['docstring'] == 'Reset state'
+
+
+def test_cart_items_shape():
+    '''items maps each name to its entries, oldest first, and removal takes the oldest'''
+    cart = ShoppingCart()
+    cart.add_item('apple', 0.5, 2)
+    cart.add_item('pear', 1.25)
+    cart.add_item('apple', 0.75)
+    assert cart.items == {
+        'apple': [{'item': 'apple', 'price': 0.5, 'quantity': 2}, {'item': 'apple', 'price': 0.75, 'quantity': 1}],
+        'pear': [{'item': 'pear', 'price': 1.25, 'quantity': 1}],
+    }
+    
+    assert cart.remove_item('apple')
+    assert cart.items['apple'] == [{'item': 'apple', 'price': 0.75, 'quantity': 1}]
+
+
+def test_cart_tax_rounds_down_to_the_cent():
+    '''Totals are exact in cents and tax is floored to a whole cent'''
+    cart = ShoppingCart()
+    cart.add_item('pen', 0.99, 3)
+    #2.97 * 8% = 0.2376
+    assert cart.get_subtotal_cents() == 297
+    assert cart.get_tax_amount_cents() == 23
+    assert cart.get_tax_amount() == 0.23
+    assert cart.get_total() == 3.2
+    
+    #0.1 + 0.2 is exact in cents, unlike float sums
+    cart.clear_cart()
+    cart.add_item('a', 0.1)
+    cart.add_item('b', 0.2)
+    assert cart.get_subtotal() == 0.3
+    assert cart.get_total_cents() == 32
+
+
+def test_except_block_fallbacks_are_not_targets(analyzer):
+    '''Functions defined as import fallbacks in an except block are skipped'''
+    code = ('try:\n    from numba import njit\nexcept ImportError:\n    def njit(*args, **kwargs):\n'
+            '        return lambda func: func\n\n\n@njit(cache=True)\ndef add(a, b):\n    return a + b\n')
+    assert [function['name'] for function in analyzer.extract_functions(code, 'python')] == ['add']
@@ -1,16 +1,128 @@
 import os
-import openai
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 import json
-import sys
+import hashlib
+import logging
+import sqlite3
+from contextlib import closing
+from functools import lru_cache, partial
 from pathlib import Path
 from dotenv import load_dotenv
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
 
 load_dotenv()
 OPEN_AI_KEY = os.getenv("OPEN_AI_KEY")
 
+#prompt skeletons - only the named fields are filled in per call
+_SYSTEM_PROMPT_TEMPLATE = """
+            You are an expert test engineer. Your task is to generate comprehensive, high-quality
+            unit test.
+
+            REQUIREMENTS:
+            - Use {test_framework} as the testing framework
+            - Follow language-specific testing best practices
+            - Include proper setup and teardown when needed
+            - Use descriptive test names that explain what is being tested
+            - Add docstrings to test functions
+            - Handle dependencies and mocking appropriately
+
+            PROJECT CONTEXT:
+            - Language: {language}
+            - Test Framework: {test_framework}
+            - Build Tool: {build_tool}
+            - Source Directory: {source_directory}
+            - Test Directory: {test_directory}
+
+            EXISTING TEST PATTERNS:
+            - Test file count: {test_count}
+            - Naming patterns: {naming_patterns}
+
+            DEPENDENCIES TO CONSIDER:
+            {dependencies}
+
+            Generate complete, runnable test code that can be executed immediately
+        """
+
+_USER_PROMPT_TEMPLATE = """
+            Generate comprehensive unit tests for the following code:
+
+            SOURCE CODE:
+            {source_code}
+
+            FUNCTIONS TO TEST:
+            {functions}
+
+            REQUIREMENTS:
+            1. Create a complete test file that can run independently
+            2. Test all public functions and methods
+            3. Include tests for:
+                - Normal/happy path scenarios
+                - Edge cases (empty inputs, boundary values , etc)
+                - Error conditions and exception handline
+                - Different input types where applicable
+            4. Use proper fixtures and setup for class-based tests
+            5. Mock external dependencies if needed
+            6. Follow the existing project's testsing patterns where possible
+
+            Generate only the test code, no explanations or markdown formatting
+        """
+
+@lru_cache(maxsize=128)
+def _format_dependencies(dependencies: tuple) -> str:
+    """Format dependencies for the prompt - dependencies rarely change between calls"""
+    if not dependencies:
+        return "No external dependencies detected"
+    
+    formatted = []
+    for i , dep in enumerate(dependencies):
+        formatted.append(f"- {i}: {dep}")
+    return "\n".join(formatted)
+
+@lru_cache(maxsize=1024)
+def _format_function(name, parameter_names: tuple, return_type, complexity, docstring) -> str:
+    """Format one function's prompt block; docstring is already cut to 200 chars"""
+    #short unindented lines - leading whitespace is sent to the LLM as tokens
+    parts = [
+        f"Function: {name}\n",
+        f"- Parameters: {list(parameter_names)}\n",
+        f"- Return Type: {return_type}\n",
+        f"- Complexity: {complexity}\n",
+        f"- Has Docstring: {bool(docstring)}\n",
+    ]
+    if docstring:
+        parts.append(f"- Documentation: {docstring}...\n")
+    return "".join(parts)
+
+def _iter_function_lines(functions):
+    """Yield the prompt lines for each function, with a blank line between functions"""
+    for i, func in enumerate(functions):
+        if i:
+            yield "\n"
+        #scaffolder output carries the preview already; plain dicts are cut here
+        preview = func.get('doc_preview')
+        if preview is None:
+            docstring = func.get('docstring')
+            preview = docstring[:200] if docstring else None
+        yield _format_function(
+            func.get('name', 'unknown'),
+            tuple(p.get('name') for p in func.get('parameters', [])),
+            func.get('return_type', 'unknown'),
+            func.get('complexity', 1),
+            preview,
+        )
+
+_PATH_SEPARATORS_TO_DOTS = str.maketrans({'/': '.', '\\': '.'})
+
+@lru_cache(maxsize=1024)
+def _module_name_from_path(file_path: str) -> str:
+    """Dotted import path for a relative .py file path"""
+    module_name = file_path.removesuffix('.py').translate(_PATH_SEPARATORS_TO_DOTS)
+    if module_name.startswith('.'):
+        module_name = module_name[1:]
+    return module_name
+
 @dataclass
 class TestGenerationPrompt:
     """Structure for organizing test generation prompts"""
@@ -18,21 +130,78 @@ class TestGenerationPrompt:
     user_prompt: str
     context: Dict[str , Any]
 
+#completions keyed on everything that determines them, shared across runs
+_LLM_CACHE_DB = Path('~/.autocover/llm_cache.sqlite').expanduser()
+
+
+def _llm_cache_key(model: str, system_prompt: str, user_prompt: str, temperature: float) -> str:
+    canonical = json.dumps([model, system_prompt, user_prompt, temperature])
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _open_llm_cache() -> sqlite3.Connection:
+    _LLM_CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(_LLM_CACHE_DB)
+    conn.execute('CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, response TEXT)')
+    return conn
+
+
+def _load_cached_response(key: str) -> Optional[str]:
+    """Return the cached completion for key, or None on a miss"""
+    try:
+        with closing(_open_llm_cache()) as conn:
+            row = conn.execute('SELECT response FROM llm_cache WHERE key=?', (key,)).fetchone()
+        return row[0] if row else None
+    except Exception as e:
+        logger.warning("Error reading LLM cache: %s", e)
+        return None
+
+
+def _store_cached_response(key: str, response: str):
+    """Persist a completion under key"""
+    try:
+        with closing(_open_llm_cache()) as conn, conn:
+            conn.execute('INSERT OR REPLACE INTO llm_cache (key, response) VALUES (?, ?)', (key, response))
+    except Exception as e:
+        logger.warning("Error writing LLM cache: %s", e)
+
 class OpenAITestGenerator:
+    model = "gpt-4o"
+    temperature = 0.1
+
     def __init__(self, api_key):
         self.api_key = api_key
-
-    def generate_tests(self, prompt):
-        client = openai.OpenAI(api_key=self.api_key)
-        response = client.chat.completions.create(
-            model="gpt-4o",
+        #built on first use and reused so calls share one connection pool
+        self._client = None
+        #chat.completions.create with the static request options already bound
+        self._create_completion = None
+
+    def generate_tests(self, prompt, bypass_cache=False):
+        """Return the completion for prompt, reusing a cached one unless bypass_cache is set"""
+        key = _llm_cache_key(self.model, prompt.system_prompt, prompt.user_prompt, self.temperature)
+        if not bypass_cache:
+            cached = _load_cached_response(key)
+            if cached is not None:
+                return cached
+
+        if self._client is None:
+            import openai
+            self._client = openai.OpenAI(api_key=self.api_key)
+            self._create_completion = partial(
+                self._client.chat.completions.create,
+                model=self.model,
+                temperature=self.temperature
+            )
+        response = self._create_completion(
             messages=[
                 {"role": "system", "content": prompt.system_prompt},
                 {"role": "user", "content": prompt.user_prompt}
-            ],
-            temperature=0.1
+            ]
         )
-        return response.choices[0].message.content
+        content = response.choices[0].message.content
+        if content is not None:
+            _store_cached_response(key, content)
+        return content
 
 class TestGenerator:
     """Handles test code generation using LLM"""
@@ -45,6 +214,7 @@ class TestGenerator:
 
         """
         self.llm_client = llm_client
+        self._openai_generator = None
 
     def create_generation_prompt(self, state: Dict[str, Any]) -> TestGenerationPrompt:
         """
@@ -65,60 +235,21 @@ class TestGenerator:
         existing_patterns = state.get('existing_patterns', {})
         source_code = state.get('source_code', '')
 
-        #build system prompt
-        system_prompt = f"""
-            You are an expert test engineer. Your task is to generate comprehensive, high-quality
-            unit test.
-
-            REQUIREMENTS:
-            - Use {test_framework} as the testing framework
-            - Follow language-specific testing best practices
-            - Include proper setup and teardown when needed
-            - Use descriptive test names that explain what is being tested
-            - Add docstrings to test functions
-            - Handle dependencies and mocking appropriately
-
-            PROJECT CONTEXT:
-            - Language: {project_context.get('language', '')}
-            - Test Framework: {test_framework}
-            - Build Tool: {project_context.get('build_tool', '')}
-            - Source Directory: {project_context.get('source_directory','')}
-            - Test Directory: {project_context.get('test_directory', '')}
-
-            EXISTING TEST PATTERNS:
-            - Test file count: {existing_patterns.get('test_count', 0)}
-            - Naming patterns: {existing_patterns.get('naming_patterns', [])}
-
-            DEPENDENCIES TO CONSIDER:
-            {self._format_dependencies(dependencies)}
-
-            Generate complete, runnable test code that can be executed immediately
-        """
-
-        #build user prompt with function details
-        user_prompt = f"""
-            Generate comprehensive unit tests for the following code:
-
-            SOURCE CODE:
-            {source_code}
-
-            FUNCTIONS TO TEST:
-            {self._format_functions_for_prompt(target_functions)}
-
-            REQUIREMENTS:
-            1. Create a complete test file that can run independently
-            2. Test all public functions and methods
-            3. Include tests for:
-                - Normal/happy path scenarios
-                - Edge cases (empty inputs, boundary values , etc)
-                - Error conditions and exception handline
-                - Different input types where applicable
-            4. Use proper fixtures and setup for class-based tests
-            5. Mock external dependencies if needed
-            6. Follow the existing project's testsing patterns where possible
-
-            Generate only the test code, no explanations or markdown formatting
-        """
+        #fill the prompt templates
+        system_prompt = _SYSTEM_PROMPT_TEMPLATE.format_map({
+            'test_framework': test_framework,
+            'language': project_context.get('language', ''),
+            'build_tool': project_context.get('build_tool', ''),
+            'source_directory': project_context.get('source_directory', ''),
+            'test_directory': project_context.get('test_directory', ''),
+            'test_count': existing_patterns.get('test_count', 0),
+            'naming_patterns': existing_patterns.get('naming_patterns', []),
+            'dependencies': self._format_dependencies(dependencies),
+        })
+        user_prompt = _USER_PROMPT_TEMPLATE.format_map({
+            'source_code': source_code,
+            'functions': self._format_functions_for_prompt(target_functions),
+        })
         return TestGenerationPrompt(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
@@ -131,41 +262,22 @@ class TestGenerator:
     
     def _format_dependencies(self, dependencies: List[str]) -> str:
         """Format dependencies for the prompt"""
-        if not dependencies:
-            return "No external dependencies detected"
-        
-        formatted = []
-        for i , dep in enumerate(dependencies):
-            formatted.append(f"- {i}: {dep}")
-        return "\n".join(formatted)
+        return _format_dependencies(tuple(dependencies))
     
     def _format_functions_for_prompt(self, functions: List[Dict]) -> str:
         """Format function information for the prompt"""
         if not functions:
             return "No functions detected"
         
-        formatted = []
-        for func in functions:
-            func_info = f"""
-                Function: {func.get('name', 'unknown')}
-                - Parameters: {[p.get('name') for p in func.get('parameters', [])]}
-                - Return Type: {func.get('return_type', 'unknown')}
-                - Complexity: {func.get('complexity', 1)}
-                - Has Docstring: {bool(func.get('docstring'))}
-            """
-            if func.get('docstring'):
-                func_info += f"\n- Documentation: {func['docstring'][:200]}..."
-
-            formatted.append(func_info)
-
-        return "\n".join(formatted)
+        return "".join(_iter_function_lines(functions))
     
-    def generate_tests(self, prompt: TestGenerationPrompt) -> str:
+    def generate_tests(self, prompt: TestGenerationPrompt, bypass_cache: bool = False) -> str:
         """
         Generate test code using LLM
 
         Args:
             prompt: TestGenerationPrompt with system and user prompts
+            bypass_cache: Skip cached completions and always call the LLM
 
         Returns:
             Generated test code as string
@@ -178,14 +290,15 @@ class TestGenerator:
         try:
             #open AI integration - i would make it more LLM agnostic later
             
-            #initialize client
-            print(f"USING THE OPEN AI CLIENT")
-            client = OpenAITestGenerator(api_key=OPEN_AI_KEY)
-            response = client.generate_tests(prompt)
-            # print(f"Response from Client is: {response}")
+            #initialize client once per generator
+            logger.info("USING THE OPEN AI CLIENT")
+            if self._openai_generator is None:
+                self._openai_generator = OpenAITestGenerator(api_key=OPEN_AI_KEY)
+            response = self._openai_generator.generate_tests(prompt, bypass_cache=bypass_cache)
+            # logger.debug("Response from Client is: %s", response)
             return response
         except Exception as e:
-            print(f"LLM generation failed: {e}")
+            logger.warning("LLM generation failed: %s", e)
             return self._generate_template_tests(prompt.context)
     
     def _generate_template_tests(self, context: Dict[str, Any]) -> str:
@@ -203,25 +316,21 @@ class TestGenerator:
         target_functions = context.get('target_functions', [])
         test_framework = context.get('test_framework', 'pytest')
         
-        # Generate imports
-        imports = [
-            "import pytest",
-            "from unittest.mock import Mock, patch, MagicMock"
-        ]
-        
         # Try to determine import path
         project_context = context.get('project_context', {})
         file_path = project_context.get('relative_path', '')
         
+        # Generate imports
+        imports = (
+            "import pytest",
+            "from unittest.mock import Mock, patch, MagicMock",
+        )
         if file_path:
-            module_name = file_path.replace('.py', '').replace('/', '.').replace('\\', '.')
-            if module_name.startswith('.'):
-                module_name = module_name[1:]
-            imports.append(f"from {module_name} import *")
+            imports += (f"from {_module_name_from_path(file_path)} import *",)
         
-        # Generate test class/functions
+        # Generate test class/functions - imports go in as lines so everything is joined once
         test_code_parts = [
-            "\n".join(imports),
+            *imports,
             "",
             "",
             "class TestGeneratedTests:",
@@ -279,6 +388,12 @@ class TestGenerator:
         
         return tests
     
+@lru_cache(maxsize=None)
+def _get_test_generator(llm_client: str = "OpenAI") -> TestGenerator:
+    """Shared generator per LLM client, so graph calls reuse its API client"""
+    return TestGenerator(llm_client=llm_client)
+
+
 def generator_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     LangGraph node for generating test code
@@ -288,23 +403,23 @@ def generator_node(state: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Updated state with generated tests
     """  
-    print("🔄 Running Generator Node...") 
+    logger.info("🔄 Running Generator Node...")
 
     try:
-        #initialize generator
-        generator = TestGenerator(llm_client="OpenAI")
+        #reuse the generator - it holds the lazily created OpenAI client
+        generator = _get_test_generator("OpenAI")
 
         #create generation prompt
         prompt = generator.create_generation_prompt(state)
 
-        print(f" Generating tests for {len(state.get('target_functions', []))} functions...")
+        logger.info(" Generating tests for %d functions...", len(state.get('target_functions', [])))
 
         #Generate tests
         generated_tests = generator.generate_tests(prompt)
 
-        #Update state
-        updated_state = state.copy()
-        updated_state.update({
+        #Update state - one merge instead of copy + update
+        updated_state = {
+            **state,
             'generated_tests': generated_tests,
             'generation_attempt' : state.get('generation_attempt', 0) + 1,
             'generation_context': {
@@ -315,32 +430,35 @@ def generator_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 'function_count': len(state.get('target_functions', [])),
                 'framework': state.get('test_framework', '')
             }
-        }) 
-        print(f"Generated {len(generated_tests.splitlines())} lines of test code")
+        }
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Generated %d lines of test code", len(generated_tests.splitlines()))
         return updated_state
 
     except Exception as e:
-        print(f"Generator failed: {e}")
+        logger.error("Generator failed: %s", e)
         # Return state with error information
-        error_state = state.copy()
-        error_state.update({
+        error_state = {
+            **state,
             'generated_tests': None,
             'generation_attempt': state.get('generation_attempt', 0) + 1,
             'generation_error': str(e)
-        })
+        }
         
         return error_state 
 
      
 if __name__ == "__main__":
+    #run from the repo root as `python -m node_2.generator`
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     #scaffolder output 
-    from node_1.scaffolder import scaffolder_node, AutoCoverState
+    from node_1.scaffolder import scaffolder_node, AutoCoverState, read_source_file
     #lets call it mockstate
     target_file = Path("/Users/eazilove/Documents/agent-unit-test/node_1/test_script.py")
     
     try:
         # Read the actual source code
-        source_code = target_file.read_text()
+        source_code = read_source_file(target_file)
         
         # Create state with real file path
         test_state = AutoCoverState(
@@ -368,11 +486,11 @@ if __name__ == "__main__":
     #test the generator
     result = generator_node(scaffolder_result)
     
-    print("\n" + "="*50)
-    print("GENERATOR RESULTS")
-    print("="*50)
-    print(f"Generation Attempt: {result.get('generation_attempt')}")
-    print(f"Generated Tests Length: {len(result.get('generated_tests', ''))}")
-    print("\nGENERATED TEST CODE:")
-    print("-" * 30)
-    print(result.get('generated_tests', 'No tests generated'))
+    logger.info("\n" + "="*50)
+    logger.info("GENERATOR RESULTS")
+    logger.info("="*50)
+    logger.info("Generation Attempt: %s", result.get('generation_attempt'))
+    logger.info("Generated Tests Length: %d", len(result.get('generated_tests', '')))
+    logger.info("\nGENERATED TEST CODE:")
+    logger.info("-" * 30)
+    logger.info("%s", result.get('generated_tests', 'No tests generated'))
@@ -1,17 +1,388 @@
 import os
+import io
+import asyncio
+import sys
+import atexit
+import signal
 import subprocess
 import tempfile
 import shutil
 import json
+import keyword
 import re
-import sys
+import hashlib
+import xml.etree.ElementTree as ET
+import threading
+import importlib.util
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout, redirect_stderr
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Sequence, Tuple, Union
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from node_1.scaffolder import AutoCoverState, scaffolder_node
-from node_2.generator import generator_node
+
+try:
+    import orjson
+except ImportError:  # optional - the stdlib json module does the same job, slower
+    orjson = None
+
+
+def _json_dumps_pretty(obj: Any) -> str:
+    """Serialize obj as 2-space indented JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+#markdown fences LLMs wrap generated code in: a per-language opening fence or any closing fence
+_PYTHON_FENCE_RE = re.compile(r'```python\s*\n?|```\s*$', re.MULTILINE)
+_JAVASCRIPT_FENCE_RE = re.compile(r'```(?:javascript|js)\s*\n?|```\s*$', re.MULTILINE)
+_TYPESCRIPT_FENCE_RE = re.compile(r'```(?:typescript|ts)\s*\n?|```\s*$', re.MULTILINE)
+_JAVA_FENCE_RE = re.compile(r'```java\s*\n?|```\s*$', re.MULTILINE)
+_PYTHON_FENCE_TAGS = frozenset({'', 'python'})
+_JAVASCRIPT_FENCE_TAGS = frozenset({'', 'javascript', 'js'})
+_TYPESCRIPT_FENCE_TAGS = frozenset({'', 'typescript', 'ts'})
+_JAVA_FENCE_TAGS = frozenset({'', 'java'})
+
+
+def _strip_code_fences(code: str, fence_tags: frozenset, fence_re: re.Pattern) -> str:
+    """Remove markdown fences, with plain string ops when the whole reply is one fenced block"""
+    stripped = code.strip()
+    if stripped.startswith('```') and stripped.endswith('```'):
+        info, newline, rest = stripped[3:].partition('\n')
+        body, closing, _ = rest.rpartition('```')
+        if newline and closing and info.strip() in fence_tags and '```' not in body:
+            return body
+    #fences in the middle of the reply, or not the kind we know - let the regex find them
+    return fence_re.sub('', code)
+
+#pytest runs in long-lived workers that import it once, instead of a cold `python -m pytest` per run
+_HAS_PYTEST = importlib.util.find_spec('pytest') is not None
+_RUNNER_POOL_SIZE = min(4, os.cpu_count() or 1)
+#pytest-xdist splits a cold `python -m pytest` run across cores, sized like the warm pool it stands in for.
+#warm runners never use it - its workers would be fresh interpreters, undoing the warm start
+_XDIST_WORKERS = max(1, (os.cpu_count() or 1) // _RUNNER_POOL_SIZE) if importlib.util.find_spec('xdist') else 1
+#seconds one suite may run once its worker starts it - time spent queued behind other suites doesn't count
+_PYTEST_RUN_TIMEOUT = 300
+#seconds a timed-out suite gets to stop after being interrupted before its worker exits
+_PYTEST_KILL_GRACE = 10
+#left in a project by a worker that had to exit over a hung suite, so the parent doesn't rerun it cold
+_TIMED_OUT_MARKER = '.autocover_timed_out'
+_runner_pool: Optional[ProcessPoolExecutor] = None
+_runner_pool_lock = threading.Lock()
+
+
+def _get_runner_pool() -> ProcessPoolExecutor:
+    """Return the shared runner pool, starting it on first use"""
+    global _runner_pool
+    with _runner_pool_lock:
+        if _runner_pool is None:
+            _runner_pool = ProcessPoolExecutor(max_workers=_RUNNER_POOL_SIZE, initializer=_init_pytest_worker)
+            atexit.register(shutdown_runner_pool)
+        return _runner_pool
+
+
+def shutdown_runner_pool():
+    """Stop the shared runner pool; a later run starts a new one"""
+    global _runner_pool
+    with _runner_pool_lock:
+        if _runner_pool is not None:
+            _runner_pool.shutdown()
+            _runner_pool = None
+            atexit.unregister(shutdown_runner_pool)
+
+
+def _discard_runner_pool(pool: ProcessPoolExecutor):
+    """Drop a pool whose worker died; the next run starts a fresh one"""
+    global _runner_pool
+    with _runner_pool_lock:
+        if _runner_pool is pool:
+            _runner_pool = None
+            atexit.unregister(shutdown_runner_pool)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _init_pytest_worker():
+    import pytest  # noqa: F401 - paid once per worker, reused by every run
+
+
+class _InMemoryReporter:
+    """pytest plugin that keeps per-test outcomes in memory instead of writing a report file"""
+
+    def __init__(self):
+        self.collected = 0
+        self.tests = []
+
+    def pytest_collection_finish(self, session):
+        self.collected = len(session.items)
+
+    def pytest_runtest_logreport(self, report):
+        #the call phase decides the outcome; setup/teardown only matter when they didn't pass
+        if report.when == 'call':
+            outcome = report.outcome
+        elif report.failed:
+            outcome = 'error'
+        elif report.skipped:
+            outcome = 'skipped'
+        else:
+            return
+        self.tests.append({'nodeid': report.nodeid, 'outcome': outcome, 'longrepr': report.longreprtext})
+
+
+def _pytest_watchdog(temp_dir: str, timeout: float, finished: threading.Event, timed_out: threading.Event):
+    """Interrupt this worker's run once it passes timeout; exit the worker if the run ignores that"""
+    if finished.wait(timeout):
+        return
+    timed_out.set()
+    #a real signal, so blocking calls like sleep wake up too; pytest stops the run as on Ctrl-C
+    os.kill(os.getpid(), signal.SIGINT)
+    if not finished.wait(_PYTEST_KILL_GRACE):
+        #stuck where signals don't reach (e.g. inside C code) - this worker can't be reused
+        (Path(temp_dir) / _TIMED_OUT_MARKER).touch()
+        os._exit(1)
+
+
+def _run_pytest_in_worker(temp_dir: str, args: Sequence[str], extra_paths: List[str] = (),
+                          timeout: Optional[float] = None) -> Tuple[subprocess.CompletedProcess, Dict[str, Any]]:
+    """Run pytest.main for one project inside a pool worker, returning the run and its report"""
+    import pytest
+
+    cwd = os.getcwd()
+    saved_path = list(sys.path)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    reporter = _InMemoryReporter()
+    finished, timed_out = threading.Event(), threading.Event()
+
+    def interrupt(signum, frame):
+        #a late signal after the run ended must not escape into the pool's worker loop
+        if not finished.is_set():
+            raise KeyboardInterrupt
+
+    saved_handler = signal.signal(signal.SIGINT, interrupt)
+    if timeout:
+        threading.Thread(target=_pytest_watchdog, args=(temp_dir, timeout, finished, timed_out), daemon=True).start()
+    try:
+        os.chdir(temp_dir)
+        sys.path[:0] = extra_paths
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                returncode = int(pytest.main(list(args), plugins=[reporter]))
+            except KeyboardInterrupt:
+                returncode = int(pytest.ExitCode.INTERRUPTED)
+    finally:
+        finished.set()
+        signal.signal(signal.SIGINT, saved_handler)
+        os.chdir(cwd)
+        sys.path[:] = saved_path
+        #forget this project's modules so the next run imports its own src/tests packages
+        prefixes = tuple({os.path.join(temp_dir, ''), os.path.join(os.path.realpath(temp_dir), '')})
+        for name, module in list(sys.modules.items()):
+            if (getattr(module, '__file__', None) or '').startswith(prefixes):
+                del sys.modules[name]
+    completed = subprocess.CompletedProcess(['pytest', *args], returncode, stdout.getvalue(), stderr.getvalue())
+    return completed, {'collected': reporter.collected, 'tests': reporter.tests, 'timed_out': timed_out.is_set()}
+
+
+@lru_cache(maxsize=None)
+def _maven_command(*args: str) -> Tuple[str, ...]:
+    """Maven argv for args, built once - prefers the Maven daemon when installed so runs reuse a warm JVM"""
+    return ('mvnd' if shutil.which('mvnd') else 'mvn', *args)
+
+
+#lines of child output kept per command - parsers only look at the end, the rest is dropped as it streams
+_OUTPUT_TAIL_LINES = 4096
+
+
+def _run_streamed(cmd: Sequence[str], cwd: Path, env: Optional[Dict[str, str]] = None,
+                  tail: int = _OUTPUT_TAIL_LINES) -> subprocess.CompletedProcess:
+    """Run cmd with stderr folded into stdout, keeping only the last `tail` lines of output"""
+    lines = deque(maxlen=tail)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                          bufsize=1 << 16, cwd=cwd, env=env) as proc:
+        for line in proc.stdout:
+            lines.append(line)
+        returncode = proc.wait()
+    return subprocess.CompletedProcess(cmd, returncode, ''.join(lines), '')
+
+
+#jest runs inside one long-lived node process, so a run skips node startup and re-requiring jest.
+#requests and replies are one JSON object per line; jest's own output is captured into the reply
+_JEST_DAEMON_SCRIPT = r"""
+const readline = require('readline');
+const reply = process.stdout.write.bind(process.stdout);
+const streams = [process.stdout, process.stderr];
+let queue = Promise.resolve();
+
+async function handle({cwd, options}) {
+  let jest;
+  try {
+    jest = require(require.resolve('jest', {paths: [cwd]}));
+  } catch (e) {
+    return {error: String(e)};
+  }
+  const output = [];
+  const writes = streams.map((stream) => stream.write);
+  for (const stream of streams) {
+    stream.write = (chunk, ...rest) => {
+      output.push(String(chunk));
+      const callback = rest.find((arg) => typeof arg === 'function');
+      if (callback) callback();
+      return true;
+    };
+  }
+  try {
+    process.chdir(cwd);
+    const {results} = await jest.runCLI({_: [], $0: 'jest', ...options}, [cwd]);
+    //the same shape `jest --json` prints, so one parser reads both
+    const report = {
+      success: results.success,
+      numTotalTests: results.numTotalTests,
+      numPassedTests: results.numPassedTests,
+      numFailedTests: results.numFailedTests,
+      testResults: results.testResults.map((suite) => ({assertionResults: suite.testResults})),
+    };
+    return {success: results.success, stdout: output.join('') + '\n' + JSON.stringify(report) + '\n'};
+  } catch (e) {
+    return {error: String(e && e.stack || e)};
+  } finally {
+    streams.forEach((stream, i) => { stream.write = writes[i]; });
+  }
+}
+
+readline.createInterface({input: process.stdin}).on('line', (line) => {
+  queue = queue.then(() => handle(JSON.parse(line))).then((response) => reply(JSON.stringify(response) + '\n'));
+});
+"""
+
+
+#the same jest flags for both paths - runCLI options for the daemon, argv for a cold run.
+#--json puts the machine-readable report on stdout; the human summary goes to stderr
+_JEST_OPTIONS = {'silent': True, 'maxWorkers': '50%'}
+_JEST_CMD = ('npx', 'jest', '--json', '--silent', '--maxWorkers=50%')
+
+
+class _JestDaemon:
+    """One warm node process running jest in-process, started on first use"""
+    
+    def __init__(self):
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def run(self, cwd: Path, options: Dict[str, Any]) -> Optional[subprocess.CompletedProcess]:
+        """Run jest for cwd; None when the daemon is busy or can't run jest there, so the caller runs it cold"""
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            if self._proc is None or self._proc.poll() is not None:
+                self._proc = subprocess.Popen(['node', '-e', _JEST_DAEMON_SCRIPT], stdin=subprocess.PIPE,
+                                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            self._proc.stdin.write(json.dumps({'cwd': str(cwd), 'options': options}) + '\n')
+            self._proc.stdin.flush()
+            line = self._proc.stdout.readline()
+            if not line:
+                #the daemon died mid-run - a later run starts a fresh one
+                self._proc = None
+                return None
+            response = _json_loads(line)
+            if 'error' in response:
+                return None
+            return subprocess.CompletedProcess(['jest', *options], 0 if response['success'] else 1, response['stdout'], '')
+        except OSError:
+            self._proc = None
+            return None
+        finally:
+            self._lock.release()
+    
+    def shutdown(self):
+        with self._lock:
+            if self._proc is not None:
+                self._proc.stdin.close()
+                self._proc.wait()
+                self._proc = None
+
+
+_jest_daemon = _JestDaemon() if shutil.which('node') else None
+if _jest_daemon is not None:
+    atexit.register(_jest_daemon.shutdown)
+
+
+def _run_jest(temp_dir: Path) -> subprocess.CompletedProcess:
+    """Run the project's jest suite, in the warm daemon when it is free, else as a cold npx process"""
+    if _jest_daemon is not None:
+        result = _jest_daemon.run(temp_dir, _JEST_OPTIONS)
+        if result is not None:
+            return result
+    return _run_streamed(_JEST_CMD, cwd=temp_dir)
+
+
+def _ram_backed_tmp_root() -> str:
+    """Pick a RAM-backed directory for temp projects when one is writable, else the usual temp dir"""
+    for candidate in ('/dev/shm', os.environ.get('XDG_RUNTIME_DIR')):
+        if candidate and os.path.isdir(candidate) and os.access(candidate, os.W_OK | os.X_OK):
+            return candidate
+    return tempfile.gettempdir()
+
+
+#temp project trees are deleted here, off the path that returns test results
+_trash_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='autocover-trash')
+atexit.register(_trash_pool.shutdown, wait=True)
+
+
+#resolved dependencies, kept across runs and linked into each temp project
+_DEP_CACHE_ROOT = Path('~/.cache/autocover').expanduser()
+#where a Python project's cached dependencies are linked, put on the path for its test run
+_PYTHON_DEPS_LINK = '.deps'
+
+
+def _dep_cache_key(spec: str) -> str:
+    return hashlib.sha256(spec.encode('utf-8')).hexdigest()[:16]
+
+
+def _populate_dep_cache(cache_dir: Path, install: Callable[[Path], bool]) -> bool:
+    """Fill cache_dir via install(staging_dir) unless an earlier run already did"""
+    if cache_dir.exists():
+        return True
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    #install beside the final location and rename, so a half-finished install is never reused
+    staging = Path(tempfile.mkdtemp(prefix=f"{cache_dir.name}.", dir=cache_dir.parent))
+    try:
+        if not install(staging):
+            return False
+        try:
+            staging.rename(cache_dir)
+        except OSError:
+            pass  # a concurrent run populated it first
+        return True
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+_NPM_INSTALL_CMD = ('npm', 'install')
+
+
+def _link_node_modules(temp_dir: Path, package_json_text: str, language: str) -> bool:
+    """Link a cached node_modules for this exact package.json into temp_dir, installing it once"""
+    cache_dir = _DEP_CACHE_ROOT / language / _dep_cache_key(package_json_text)
+
+    def npm_install(staging: Path) -> bool:
+        (staging / 'package.json').write_text(package_json_text)
+        result = _run_streamed(_NPM_INSTALL_CMD, cwd=staging)
+        return result.returncode == 0
+
+    if not _populate_dep_cache(cache_dir, npm_install):
+        return False
+    (temp_dir / 'node_modules').symlink_to(cache_dir / 'node_modules', target_is_directory=True)
+    return True
+
 @dataclass
 class TestResult:
     """Language-agnostic test result representation"""
@@ -23,6 +394,14 @@ class TestResult:
 class LanguageHandler(ABC):
     """Abstract base class for language-specific test execution"""
     
+    @classmethod
+    def instance(cls) -> 'LanguageHandler':
+        """Shared instance of this handler - handlers keep no per-run state"""
+        handler = cls.__dict__.get('_instance')
+        if handler is None:
+            handler = cls._instance = cls()
+        return handler
+    
     @abstractmethod
     def get_file_extensions(self) -> Dict[str, str]:
         """Return file extensions for source and test files"""
@@ -57,10 +436,28 @@ class LanguageHandler(ABC):
     def clean_generated_code(self, code: str) -> str:
         """Clean generated code (remove markdown, fix imports, etc.)"""
         pass
+    
+    async def write_files_async(self, dirs: Dict[str, Path], source_code: str, test_code: str,
+                                filename: str) -> Tuple[Path, Path]:
+        """Write the source and test files concurrently, off the event loop"""
+        source_file, test_file = await asyncio.gather(
+            asyncio.to_thread(self.write_source_file, dirs['source'], source_code, filename),
+            asyncio.to_thread(self.write_test_file, dirs['test'], test_code, filename)
+        )
+        return source_file, test_file
+
+#every name but dunders, underscore-prefixed helpers included - a star import would skip those and honour __all__
+_SOURCE_PACKAGE_INIT = """from . import {module}
+globals().update({{name: value for name, value in vars({module}).items() if not name.startswith('__')}})
+"""
 
 class PythonHandler(LanguageHandler):
     """Handler for Python projects"""
     
+    #argv built once per process - the one place to tune pytest flags
+    _PYTEST_ARGS = ('tests', '-v', '--tb=short')
+    _PYTEST_CMD = ('python', '-m', 'pytest') + _PYTEST_ARGS + (('-n', str(_XDIST_WORKERS)) if _XDIST_WORKERS > 1 else ())
+    
     def get_file_extensions(self) -> Dict[str, str]:
         return {"source": ".py", "test": ".py"}
     
@@ -68,18 +465,22 @@ class PythonHandler(LanguageHandler):
         src_dir = temp_dir / project_context.get('source_directory', 'src')
         test_dir = temp_dir / project_context.get('test_directory', 'tests')
         
-        src_dir.mkdir(parents=True, exist_ok=True)
-        test_dir.mkdir(parents=True, exist_ok=True)
+        for directory in (src_dir, test_dir):
+            os.makedirs(directory, exist_ok=True)
         
-        # Python package files
-        (src_dir / '__init__.py').touch()
-        (test_dir / '__init__.py').touch()
+        # Python package file - a bare open/close, without the stat + utime Path.touch adds
+        #the source package's __init__.py is written with the source file, once its module name is known
+        os.close(os.open(test_dir / '__init__.py', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
         
         return {"source": src_dir, "test": test_dir}
     
     def write_source_file(self, source_dir: Path, source_code: str, filename: str) -> Path:
         source_file = source_dir / filename
         source_file.write_text(source_code)
+        #re-export the module from the package so generated `from src import ...` lines resolve as written
+        module_name = source_file.stem
+        importable = module_name.isidentifier() and not keyword.iskeyword(module_name)
+        (source_dir / '__init__.py').write_text(_SOURCE_PACKAGE_INIT.format(module=module_name) if importable else '')
         return source_file
     
     def write_test_file(self, test_dir: Path, test_code: str, filename: str) -> Path:
@@ -94,37 +495,65 @@ class PythonHandler(LanguageHandler):
             
         requirements_file = temp_dir / 'requirements.txt'
         requirements_file.write_text('\n'.join(dependencies))
+        cache_dir = _DEP_CACHE_ROOT / 'python' / _dep_cache_key('\n'.join(sorted(dependencies)))
         
-        try:
-            result = subprocess.run([
-                'pip', 'install', '-r', str(requirements_file)
-            ], capture_output=True, text=True, cwd=temp_dir)
+        def pip_install(staging: Path) -> bool:
+            result = _run_streamed([
+                'pip', 'install', '--target', str(staging), '-r', str(requirements_file)
+            ], cwd=temp_dir, env={**os.environ, 'PIP_CACHE_DIR': str(_DEP_CACHE_ROOT / 'pip')})
             return result.returncode == 0
+        
+        try:
+            if not _populate_dep_cache(cache_dir, pip_install):
+                return False
+            (temp_dir / _PYTHON_DEPS_LINK).symlink_to(cache_dir, target_is_directory=True)
+            return True
         except Exception:
             return False
     
     def run_tests(self, temp_dir: Path, project_context: Dict) -> Dict[str, Any]:
         try:
-            cmd = ['python', '-m', 'pytest', 'tests', '-v', '--tb=short', '--json-report', '--json-report-file=results.json']
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=temp_dir)
-            return self._parse_pytest_results(temp_dir, result)
+            args = self._PYTEST_ARGS
+            deps_dir = temp_dir / _PYTHON_DEPS_LINK
+            extra_paths = [str(deps_dir)] if deps_dir.exists() else []
+            if not _HAS_PYTEST:
+                return self._parse_pytest_results(self._run_pytest_subprocess(temp_dir, extra_paths), None)
+            
+            pool = _get_runner_pool()
+            #the worker enforces the timeout from when it starts the suite
+            future = pool.submit(_run_pytest_in_worker, str(temp_dir), args, extra_paths, _PYTEST_RUN_TIMEOUT)
+            try:
+                result, report = future.result()
+            except BrokenProcessPool:
+                _discard_runner_pool(pool)
+                if (temp_dir / _TIMED_OUT_MARKER).exists():
+                    return {'success': False, 'error': f'Tests timed out after {_PYTEST_RUN_TIMEOUT} seconds'}
+                #a test killed its worker (os._exit, a crash, OOM) - rerun this suite in its own process
+                return self._parse_pytest_results(self._run_pytest_subprocess(temp_dir, extra_paths), None)
+            results = self._parse_pytest_results(result, report)
+            if report['timed_out']:
+                results.update({'success': False, 'error': f'Tests timed out after {_PYTEST_RUN_TIMEOUT} seconds'})
+            return results
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def _run_pytest_subprocess(self, temp_dir: Path, extra_paths: List[str]) -> subprocess.CompletedProcess:
+        """Run the suite in a fresh `python -m pytest`; there is no in-process report, only the exit status"""
+        env = os.environ.copy()
+        if extra_paths:
+            env['PYTHONPATH'] = os.pathsep.join(extra_paths + [env['PYTHONPATH']] if env.get('PYTHONPATH') else extra_paths)
+        return _run_streamed(self._PYTEST_CMD, cwd=temp_dir, env=env)
+    
     def clean_generated_code(self, code: str) -> str:
         # Remove markdown
-        code = re.sub(r'```python\s*\n?', '', code)
-        code = re.sub(r'```\s*$', '', code, flags=re.MULTILINE)
-        
-        # Fix imports
-        code = re.sub(r'from src import', 'from src.test_script import', code)
+        code = _strip_code_fences(code, _PYTHON_FENCE_TAGS, _PYTHON_FENCE_RE)
         
         if 'import pytest' not in code:
             code = 'import pytest\n' + code
             
         return code.strip()
     
-    def _parse_pytest_results(self, temp_dir: Path, subprocess_result) -> Dict[str, Any]:
+    def _parse_pytest_results(self, subprocess_result, report: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         results = {
             'success': subprocess_result.returncode == 0,
             'return_code': subprocess_result.returncode,
@@ -136,27 +565,21 @@ class PythonHandler(LanguageHandler):
             'failures': []
         }
         
-        # Try JSON report first
-        json_file = temp_dir / 'results.json'
-        if json_file.exists():
-            try:
-                with open(json_file) as f:
-                    data = json.load(f)
-                    summary = data.get('summary', {})
-                    results.update({
-                        'tests_run': summary.get('total', 0),
-                        'tests_passed': summary.get('passed', 0),
-                        'tests_failed': summary.get('failed', 0)
+        # Outcomes collected by the in-process reporter
+        if report:
+            tests = report['tests']
+            results.update({
+                'tests_run': report['collected'],
+                'tests_passed': sum(1 for test in tests if test['outcome'] == 'passed'),
+                'tests_failed': sum(1 for test in tests if test['outcome'] == 'failed')
+            })
+            
+            for test in tests:
+                if test['outcome'] == 'failed':
+                    results['failures'].append({
+                        'test_name': test['nodeid'],
+                        'error': test['longrepr'] or 'Unknown error'
                     })
-                    
-                    for test in data.get('tests', []):
-                        if test.get('outcome') == 'failed':
-                            results['failures'].append({
-                                'test_name': test.get('nodeid', 'unknown'),
-                                'error': test.get('call', {}).get('longrepr', 'Unknown error')
-                            })
-            except Exception:
-                pass
         
         return results
 
@@ -170,8 +593,8 @@ class JavaScriptHandler(LanguageHandler):
         src_dir = temp_dir / project_context.get('source_directory', 'src')
         test_dir = temp_dir / project_context.get('test_directory', 'tests')
         
-        src_dir.mkdir(parents=True, exist_ok=True)
-        test_dir.mkdir(parents=True, exist_ok=True)
+        for directory in (src_dir, test_dir):
+            os.makedirs(directory, exist_ok=True)
         
         return {"source": src_dir, "test": test_dir}
     
@@ -199,30 +622,41 @@ class JavaScriptHandler(LanguageHandler):
         for dep in dependencies:
             package_json["devDependencies"][dep] = "latest"
         
-        (temp_dir / 'package.json').write_text(json.dumps(package_json, indent=2))
+        package_json_text = _json_dumps_pretty(package_json)
+        (temp_dir / 'package.json').write_text(package_json_text)
         
         try:
-            result = subprocess.run(['npm', 'install'], capture_output=True, text=True, cwd=temp_dir)
-            return result.returncode == 0
+            return _link_node_modules(temp_dir, package_json_text, 'javascript')
         except Exception:
             return False
     
     def run_tests(self, temp_dir: Path, project_context: Dict) -> Dict[str, Any]:
         try:
-            cmd = ['npm', 'test', '--', '--json', '--outputFile=results.json']
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=temp_dir)
+            result = _run_jest(temp_dir)
             return self._parse_jest_results(temp_dir, result)
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def clean_generated_code(self, code: str) -> str:
         # Remove markdown
-        code = re.sub(r'```javascript\s*\n?', '', code)
-        code = re.sub(r'```js\s*\n?', '', code)
-        code = re.sub(r'```\s*$', '', code, flags=re.MULTILINE)
+        code = _strip_code_fences(code, _JAVASCRIPT_FENCE_TAGS, _JAVASCRIPT_FENCE_RE)
         
         return code.strip()
     
+    @staticmethod
+    def _find_jest_report(stdout: str) -> Dict[str, Any]:
+        """The last line of stdout that is a Jest report - console output can look like JSON too"""
+        for line in reversed(stdout.splitlines()):
+            if not line.startswith('{'):
+                continue
+            try:
+                data = _json_loads(line)
+            except ValueError:
+                continue
+            if isinstance(data, dict) and 'numTotalTests' in data:
+                return data
+        raise ValueError('no Jest JSON report in output')
+    
     def _parse_jest_results(self, temp_dir: Path, subprocess_result) -> Dict[str, Any]:
         results = {
             'success': subprocess_result.returncode == 0,
@@ -235,21 +669,22 @@ class JavaScriptHandler(LanguageHandler):
             'failures': []
         }
         
-        # Parse Jest output
+        # Parse the Jest JSON report - a single line, with Jest's console output around it
         try:
-            if 'Tests:' in subprocess_result.stdout:
-                output = subprocess_result.stdout
-                if 'failed' in output:
-                    failed_match = re.search(r'(\d+) failed', output)
-                    if failed_match:
-                        results['tests_failed'] = int(failed_match.group(1))
-                
-                if 'passed' in output:
-                    passed_match = re.search(r'(\d+) passed', output)
-                    if passed_match:
-                        results['tests_passed'] = int(passed_match.group(1))
-                
-                results['tests_run'] = results['tests_passed'] + results['tests_failed']
+            data = self._find_jest_report(subprocess_result.stdout)
+            results.update({
+                'tests_run': data.get('numTotalTests', 0),
+                'tests_passed': data.get('numPassedTests', 0),
+                'tests_failed': data.get('numFailedTests', 0)
+            })
+            
+            for suite in data.get('testResults', []):
+                for test in suite.get('assertionResults', []):
+                    if test.get('status') == 'failed':
+                        results['failures'].append({
+                            'test_name': test.get('fullName', 'unknown'),
+                            'error': '\n'.join(test.get('failureMessages', [])) or 'Unknown error'
+                        })
         except Exception:
             pass
             
@@ -265,8 +700,8 @@ class TypeScriptHandler(LanguageHandler):
         src_dir = temp_dir / project_context.get('source_directory', 'src')
         test_dir = temp_dir / project_context.get('test_directory', 'tests')
         
-        src_dir.mkdir(parents=True, exist_ok=True)
-        test_dir.mkdir(parents=True, exist_ok=True)
+        for directory in (src_dir, test_dir):
+            os.makedirs(directory, exist_ok=True)
         
         return {"source": src_dir, "test": test_dir}
     
@@ -281,8 +716,8 @@ class TypeScriptHandler(LanguageHandler):
         test_file.write_text(test_code)
         return test_file
     
-    def install_dependencies(self, temp_dir: Path, dependencies: List[str]) -> bool:
-        # Create package.json and tsconfig.json
+    def write_project_configs(self, temp_dir: Path, dependencies: List[str]) -> str:
+        """Write package.json, tsconfig.json and jest.config.json, returning the package.json text"""
         package_json = {
             "name": "autocover-test",
             "version": "1.0.0",
@@ -299,8 +734,8 @@ class TypeScriptHandler(LanguageHandler):
             "compilerOptions": {
                 "target": "ES2020",
                 "module": "commonjs",
-                "strict": true,
-                "esModuleInterop": true
+                "strict": True,
+                "esModuleInterop": True
             }
         }
         
@@ -312,39 +747,43 @@ class TypeScriptHandler(LanguageHandler):
         for dep in dependencies:
             package_json["devDependencies"][dep] = "latest"
         
-        (temp_dir / 'package.json').write_text(json.dumps(package_json, indent=2))
-        (temp_dir / 'tsconfig.json').write_text(json.dumps(tsconfig, indent=2))
-        (temp_dir / 'jest.config.json').write_text(json.dumps(jest_config, indent=2))
+        package_json_text = _json_dumps_pretty(package_json)
+        (temp_dir / 'package.json').write_text(package_json_text)
+        (temp_dir / 'tsconfig.json').write_text(_json_dumps_pretty(tsconfig))
+        (temp_dir / 'jest.config.json').write_text(_json_dumps_pretty(jest_config))
+        return package_json_text
+    
+    def install_dependencies(self, temp_dir: Path, dependencies: List[str]) -> bool:
+        package_json_text = self.write_project_configs(temp_dir, dependencies)
         
         try:
-            result = subprocess.run(['npm', 'install'], capture_output=True, text=True, cwd=temp_dir)
-            return result.returncode == 0
+            return _link_node_modules(temp_dir, package_json_text, 'typescript')
         except Exception:
             return False
     
     def run_tests(self, temp_dir: Path, project_context: Dict) -> Dict[str, Any]:
         try:
-            cmd = ['npm', 'test']
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=temp_dir)
+            result = _run_jest(temp_dir)
             return self._parse_jest_results(temp_dir, result)
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def clean_generated_code(self, code: str) -> str:
         # Remove markdown
-        code = re.sub(r'```typescript\s*\n?', '', code)
-        code = re.sub(r'```ts\s*\n?', '', code)
-        code = re.sub(r'```\s*$', '', code, flags=re.MULTILINE)
+        code = _strip_code_fences(code, _TYPESCRIPT_FENCE_TAGS, _TYPESCRIPT_FENCE_RE)
         
         return code.strip()
     
     def _parse_jest_results(self, temp_dir: Path, subprocess_result) -> Dict[str, Any]:
         # Same as JavaScript handler
-        return JavaScriptHandler()._parse_jest_results(temp_dir, subprocess_result)
+        return JavaScriptHandler.instance()._parse_jest_results(temp_dir, subprocess_result)
 
 class JavaHandler(LanguageHandler):
     """Handler for Java projects"""
     
+    #-T 1C builds modules in parallel; forkCount=1C gives Surefire one test JVM per core
+    _TEST_ARGS = ('test', '-T', '1C', '-DforkCount=1C')
+    
     def get_file_extensions(self) -> Dict[str, str]:
         return {"source": ".java", "test": ".java"}
     
@@ -353,8 +792,8 @@ class JavaHandler(LanguageHandler):
         src_main = temp_dir / 'src' / 'main' / 'java'
         src_test = temp_dir / 'src' / 'test' / 'java'
         
-        src_main.mkdir(parents=True, exist_ok=True)
-        src_test.mkdir(parents=True, exist_ok=True)
+        for directory in (src_main, src_test):
+            os.makedirs(directory, exist_ok=True)
         
         return {"source": src_main, "test": src_test}
     
@@ -409,27 +848,25 @@ class JavaHandler(LanguageHandler):
         (temp_dir / 'pom.xml').write_text(pom_xml)
         
         try:
-            result = subprocess.run(['mvn', 'dependency:resolve'], capture_output=True, text=True, cwd=temp_dir)
+            result = _run_streamed(_maven_command('dependency:resolve'), cwd=temp_dir)
             return result.returncode == 0
         except Exception:
             return False
     
     def run_tests(self, temp_dir: Path, project_context: Dict) -> Dict[str, Any]:
         try:
-            cmd = ['mvn', 'test']
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=temp_dir)
-            return self._parse_maven_results(result)
+            result = _run_streamed(_maven_command(*self._TEST_ARGS), cwd=temp_dir)
+            return self._parse_maven_results(temp_dir, result)
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def clean_generated_code(self, code: str) -> str:
         # Remove markdown
-        code = re.sub(r'```java\s*\n?', '', code)
-        code = re.sub(r'```\s*$', '', code, flags=re.MULTILINE)
+        code = _strip_code_fences(code, _JAVA_FENCE_TAGS, _JAVA_FENCE_RE)
         
         return code.strip()
     
-    def _parse_maven_results(self, subprocess_result) -> Dict[str, Any]:
+    def _parse_maven_results(self, temp_dir: Path, subprocess_result) -> Dict[str, Any]:
         results = {
             'success': subprocess_result.returncode == 0,
             'return_code': subprocess_result.returncode,
@@ -441,62 +878,104 @@ class JavaHandler(LanguageHandler):
             'failures': []
         }
         
-        # Parse Maven Surefire output
-        output = subprocess_result.stdout
+        # Parse the Surefire XML reports, one per test class
+        tests_run = failures = errors = 0
+        reports = list((temp_dir / 'target' / 'surefire-reports').glob('TEST-*.xml'))
+        for report in reports:
+            try:
+                for _, elem in ET.iterparse(report):
+                    if elem.tag == 'testcase':
+                        problem = elem.find('failure')
+                        if problem is None:
+                            problem = elem.find('error')
+                        if problem is not None:
+                            results['failures'].append({
+                                'test_name': f"{elem.get('classname', '')}.{elem.get('name', 'unknown')}",
+                                'error': problem.get('message') or problem.text or 'Unknown error'
+                            })
+                        elem.clear()
+                    elif elem.tag == 'testsuite':
+                        tests_run += int(elem.get('tests', 0))
+                        failures += int(elem.get('failures', 0))
+                        errors += int(elem.get('errors', 0))
+            except (ET.ParseError, ValueError):
+                continue
         
-        # Look for "Tests run: X, Failures: Y, Errors: Z"
-        test_summary = re.search(r'Tests run: (\d+), Failures: (\d+), Errors: (\d+)', output)
-        if test_summary:
-            tests_run = int(test_summary.group(1))
-            failures = int(test_summary.group(2))
-            errors = int(test_summary.group(3))
-            
-            results.update({
-                'tests_run': tests_run,
-                'tests_failed': failures + errors,
-                'tests_passed': tests_run - failures - errors
-            })
+        # No reports (e.g. the build stopped before Surefire) - sum each module's summary line instead
+        if not reports:
+            for match in _MAVEN_SUMMARY_RE.finditer(subprocess_result.stdout):
+                tests_run += int(match[1])
+                failures += int(match[2])
+                errors += int(match[3])
+        
+        results.update({
+            'tests_run': tests_run,
+            'tests_failed': failures + errors,
+            'tests_passed': tests_run - failures - errors
+        })
         
         return results
 
+#a module's end-of-run total; per-class lines go on with ", Time elapsed" so the line ending skips them
+_MAVEN_SUMMARY_RE = re.compile(
+    r'^(?:\[\w+\] )?Tests run: (\d+), Failures: (\d+), Errors: (\d+), Skipped: (\d+)\s*$', re.MULTILINE)
+
+_EXTENSION_LANGUAGES = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.java': 'java'
+}
+
+_HANDLER_CLASSES = {
+    'python': PythonHandler,
+    'javascript': JavaScriptHandler,
+    'typescript': TypeScriptHandler,
+    'java': JavaHandler
+}
+
 class LanguageAgnosticExecutor:
     """Language-agnostic test executor"""
     
     def __init__(self):
-        self.handlers = {
-            'python': PythonHandler(),
-            'javascript': JavaScriptHandler(),
-            'typescript': TypeScriptHandler(),
-            'java': JavaHandler()
-        }
-        self.temp_dir = None
+        #handlers are only created for the languages a run actually uses
+        self.handlers: Dict[str, LanguageHandler] = {}
+        #temp projects only hold generated files - dependencies are links into the shared cache
+        self._tmp_root = _ram_backed_tmp_root()
+    
+    @staticmethod
+    def shutdown():
+        """Stop the warm test runners shared by all executors"""
+        shutdown_runner_pool()
+    
+    def _get_handler(self, language: str) -> Optional[LanguageHandler]:
+        """Handler for language, created on first use; None when the language isn't supported"""
+        handler = self.handlers.get(language)
+        if handler is None and language in _HANDLER_CLASSES:
+            handler = self.handlers[language] = _HANDLER_CLASSES[language].instance()
+        return handler
     
     def detect_language(self, project_context: Dict, file_path: str) -> str:
         """Detect programming language from context or file extension"""
         
         # Check explicit language in project context
-        if 'language' in project_context:
-            lang = project_context['language'].lower()
-            if lang in self.handlers:
-                return lang
-        
-        # Detect from file extension
-        ext = Path(file_path).suffix.lower()
-        extension_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.java': 'java'
-        }
+        context_language = project_context.get('language')
+        if context_language and (lang := context_language.lower()) in _HANDLER_CLASSES:
+            return lang
         
-        return extension_map.get(ext, 'python')  # Default to python
+        # Detect from file extension - a dot after the first character of the last path component
+        dot = file_path.rfind('.')
+        if dot <= max(file_path.rfind('/'), file_path.rfind('\\')) + 1:
+            return 'python'
+        
+        return _EXTENSION_LANGUAGES.get(file_path[dot:].lower(), 'python')  # Default to python
     
     def execute_tests(self, source_code: str, test_code: str, file_path: str,
                      project_context: Dict, dependencies: List[str]) -> Dict[str, Any]:
         """Execute tests in a language-agnostic way"""
         
         language = self.detect_language(project_context, file_path)
-        handler = self.handlers.get(language)
+        handler = self._get_handler(language)
         
         if not handler:
             return {
@@ -504,29 +983,77 @@ class LanguageAgnosticExecutor:
                 'error': f'Unsupported language: {language}'
             }
         
+        temp_dir = None
         try:
-            # Create temporary directory
-            self.temp_dir = Path(tempfile.mkdtemp(prefix=f"autocover_{language}_"))
+            # Create temporary directory - local so concurrent runs don't share it
+            temp_dir = Path(tempfile.mkdtemp(prefix=f"autocover_{language}_", dir=self._tmp_root))
             
             # Set up project structure
-            dirs = handler.setup_project_structure(self.temp_dir, project_context)
+            dirs = handler.setup_project_structure(temp_dir, project_context)
             
-            # Clean and write files
-            clean_source = handler.clean_generated_code(source_code) if source_code else source_code
-            clean_test = handler.clean_generated_code(test_code)
+            #leaving the with block waits for the install, so cleanup never races it
+            with ThreadPoolExecutor(max_workers=1) as install_pool:
+                # Install dependencies - it doesn't read the source or test files, so start it first
+                install = install_pool.submit(handler.install_dependencies, temp_dir, dependencies)
+                
+                # Clean and write files while the install runs
+                clean_source = handler.clean_generated_code(source_code) if source_code else source_code
+                clean_test = handler.clean_generated_code(test_code)
+                
+                filename = self._source_filename(handler, file_path)
+                
+                handler.write_source_file(dirs['source'], clean_source, filename)
+                handler.write_test_file(dirs['test'], clean_test, filename)
+                
+                deps_success = install.result()
             
-            filename = Path(file_path).name
-            if not filename.endswith(handler.get_file_extensions()['source']):
-                filename += handler.get_file_extensions()['source']
+            # Run tests
+            test_results = handler.run_tests(temp_dir, project_context)
+            test_results['dependencies_installed'] = deps_success
+            test_results['language'] = language
             
-            handler.write_source_file(dirs['source'], clean_source, filename)
-            handler.write_test_file(dirs['test'], clean_test, filename)
+            return test_results
             
-            # Install dependencies
-            deps_success = handler.install_dependencies(self.temp_dir, dependencies)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Execution failed: {str(e)}',
+                'language': language
+            }
+        finally:
+            self.cleanup(temp_dir)
+    
+    async def execute_tests_async(self, source_code: str, test_code: str, file_path: str,
+                                  project_context: Dict, dependencies: List[str]) -> Dict[str, Any]:
+        """execute_tests for async callers - the file writes overlap the dependency install"""
+        
+        language = self.detect_language(project_context, file_path)
+        handler = self._get_handler(language)
+        
+        if not handler:
+            return {
+                'success': False,
+                'error': f'Unsupported language: {language}'
+            }
+        
+        temp_dir = None
+        install = None
+        try:
+            temp_dir = Path(await asyncio.to_thread(tempfile.mkdtemp, prefix=f"autocover_{language}_", dir=self._tmp_root))
+            dirs = await asyncio.to_thread(handler.setup_project_structure, temp_dir, project_context)
+            
+            # Install dependencies - it doesn't read the source or test files, so start it first
+            install = asyncio.ensure_future(asyncio.to_thread(handler.install_dependencies, temp_dir, dependencies))
+            
+            # Clean and write files while the install runs
+            clean_source = handler.clean_generated_code(source_code) if source_code else source_code
+            clean_test = handler.clean_generated_code(test_code)
+            await handler.write_files_async(dirs, clean_source, clean_test, self._source_filename(handler, file_path))
+            
+            deps_success = await install
             
             # Run tests
-            test_results = handler.run_tests(self.temp_dir, project_context)
+            test_results = await asyncio.to_thread(handler.run_tests, temp_dir, project_context)
             test_results['dependencies_installed'] = deps_success
             test_results['language'] = language
             
@@ -539,15 +1066,48 @@ class LanguageAgnosticExecutor:
                 'language': language
             }
         finally:
-            self.cleanup()
+            #let an install still running finish before its directory is removed
+            if install is not None and not install.done():
+                await asyncio.gather(install, return_exceptions=True)
+            await asyncio.to_thread(self.cleanup, temp_dir)
+    
+    @staticmethod
+    def _source_filename(handler: LanguageHandler, file_path: str) -> str:
+        filename = Path(file_path).name
+        source_extension = handler.get_file_extensions()['source']
+        if not filename.endswith(source_extension):
+            filename += source_extension
+        return filename
     
-    def cleanup(self):
-        """Clean up temporary files"""
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-            self.temp_dir = None
+    def execute_tests_batch(self, jobs: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Execute several independent test runs concurrently
+        
+        Args:
+            jobs: execute_tests keyword arguments, one dict per run
+            max_workers: thread count, defaults to the CPU count
+        
+        Returns:
+            Results in the same order as jobs
+        """
+        #threads are enough - the runs spend their time waiting on subprocesses and pool workers
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            return list(pool.map(lambda job: self.execute_tests(**job), jobs))
+    
+    def cleanup(self, temp_dir: Optional[Path]):
+        """Clean up temporary files - moved aside at once, deleted in the background"""
+        if temp_dir and temp_dir.exists():
+            trash = temp_dir.with_name(f".trash_{uuid.uuid4().hex}")
+            try:
+                temp_dir.rename(trash)
+            except OSError:
+                trash = temp_dir
+            _trash_pool.submit(shutil.rmtree, trash, ignore_errors=True)
 
-# def executor_node(state: AutoCoverState) -> AutoCoverState:
+#the graph state types live with the other nodes - imported here only, so using the executor on its own stays light
+# from node_1.scaffolder import AutoCoverState
+#
+# def executor_node(state: 'AutoCoverState') -> 'AutoCoverState':
 #     """
 #     Language-agnostic LangGraph node for executing generated tests
     
@@ -656,7 +1216,7 @@ def test_multilang_executor():
     python_state = {
         'source_code': '''def add(a, b):
     return a + b''',
-        'generated_tests': '''import pytest
+        'test_code': '''import pytest
 from src.calculator import add
 
 def test_add():
@@ -672,7 +1232,7 @@ def test_add():
     return a + b;
 }
 module.exports = { add };''',
-        'generated_tests': '''const { add } = require('../src/calculator');
+        'test_code': '''const { add } = require('../src/calculator');
 
 test('adds 1 + 2 to equal 3', () => {
     expect(add(1, 2)).toBe(3);
@@ -684,15 +1244,12 @@ test('adds 1 + 2 to equal 3', () => {
     
     executor = LanguageAgnosticExecutor()
     
-    # Test Python
-    print("Testing Python:")
-    py_result = executor.execute_tests(**python_state)
+    # Test Python and JavaScript side by side
+    print("Testing Python and JavaScript:")
+    py_result, js_result = executor.execute_tests_batch([python_state, js_state])
     print(f"Python Result: {py_result}")
-    
-    # Test JavaScript
-    print("\nTesting JavaScript:")
-    js_result = executor.execute_tests(**js_state)
-    print(f"JavaScript Result: {js_result}")
+    print(f"\nJavaScript Result: {js_result}")
 
 if __name__ == "__main__":
+    #run from the repo root as `python -m node_3.executor`
     test_multilang_executor()
\ No newline at end of file
@@ -0,0 +1,182 @@
+import json
+import subprocess
+from pathlib import Path
+
+from node_3.executor import (JavaHandler, JavaScriptHandler, LanguageAgnosticExecutor, TypeScriptHandler,
+                             shutdown_runner_pool)
+
+SOURCE = '''def add(a, b):
+    return a + b'''
+
+PASSING_TEST = '''from src.calculator import add
+
+def test_add():
+    assert add(2, 3) == 5'''
+
+PRIVATE_SOURCE = '''__all__ = ['add']
+
+def add(a, b):
+    return _checked(a) + _checked(b)
+
+def _checked(value):
+    return value'''
+
+PRIVATE_HELPER_TEST = '''from src import add, _checked
+
+def test_private_helper():
+    assert _checked(4) == 4
+    assert add(2, 3) == 5'''
+
+#kills the warm pytest worker that runs it
+EXITING_TEST = '''import os
+
+def test_exit():
+    os._exit(3)'''
+
+
+def test_worker_crash_does_not_break_later_runs():
+    executor = LanguageAgnosticExecutor()
+    try:
+        crashed = executor.execute_tests(SOURCE, EXITING_TEST, 'calculator.py', {'language': 'python'}, [])
+        assert crashed['success'] is False
+        
+        result = LanguageAgnosticExecutor().execute_tests(SOURCE, PASSING_TEST, 'calculator.py', {'language': 'python'}, [])
+        assert result['success'] is True
+        assert result['tests_passed'] == 1
+    finally:
+        shutdown_runner_pool()
+
+
+def test_typescript_project_configs(tmp_path):
+    TypeScriptHandler.instance().write_project_configs(tmp_path, ['lodash'])
+    
+    compiler_options = json.loads((tmp_path / 'tsconfig.json').read_text())['compilerOptions']
+    assert compiler_options['strict'] is True
+    assert compiler_options['esModuleInterop'] is True
+    assert json.loads((tmp_path / 'jest.config.json').read_text())['preset'] == 'ts-jest'
+    assert json.loads((tmp_path / 'package.json').read_text())['devDependencies']['lodash'] == 'latest'
+
+
+def test_package_reexports_private_names():
+    try:
+        result = LanguageAgnosticExecutor().execute_tests(PRIVATE_SOURCE, PRIVATE_HELPER_TEST, 'calculator.py', {'language': 'python'}, [])
+        assert result['success'] is True
+        assert result['tests_passed'] == 1
+    finally:
+        shutdown_runner_pool()
+
+
+SLEEPING_TEST = '''import time
+from src.calculator import add
+
+def test_slow_add():
+    time.sleep(1.5)
+    assert add(2, 3) == 5'''
+
+HANGING_TEST = '''import time
+
+def test_hang():
+    time.sleep(60)'''
+
+
+def test_timeout_counts_from_suite_start(monkeypatch):
+    import node_3.executor as executor_module
+    shutdown_runner_pool()
+    #workers are forked after this, so they see the shorter timeout too
+    monkeypatch.setattr(executor_module, '_PYTEST_RUN_TIMEOUT', 2)
+    job = {'source_code': SOURCE, 'test_code': SLEEPING_TEST, 'file_path': 'calculator.py',
+           'project_context': {'language': 'python'}, 'dependencies': []}
+    executor = LanguageAgnosticExecutor()
+    try:
+        #more suites than workers, so some wait in the queue longer than the timeout
+        jobs = [job] * (executor_module._RUNNER_POOL_SIZE + 1)
+        results = executor.execute_tests_batch(jobs, max_workers=len(jobs))
+        assert all(result['success'] for result in results)
+        
+        hung = executor.execute_tests(SOURCE, HANGING_TEST, 'calculator.py', {'language': 'python'}, [])
+        assert hung['success'] is False
+        assert 'timed out' in hung['error']
+        
+        result = executor.execute_tests(SOURCE, PASSING_TEST, 'calculator.py', {'language': 'python'}, [])
+        assert result['success'] is True
+    finally:
+        shutdown_runner_pool()
+
+
+JEST_REPORT = ('{"numTotalTests": 3, "numPassedTests": 2, "numFailedTests": 1, "testResults": [{"assertionResults": ['
+               '{"status": "passed", "fullName": "add works"}, {"status": "passed", "fullName": "add zero"}, '
+               '{"status": "failed", "fullName": "add negative", "failureMessages": ["expected -1"]}]}]}')
+
+
+def test_parse_jest_report_with_surrounding_noise():
+    #console output before and after the report, some of it JSON-looking
+    stdout = '\n'.join(['  console.log', '{"level": "info", "msg": "from a test"}', JEST_REPORT,
+                        '{ not json', '{"level": "debug"}', 'Done in 1.2s'])
+    result = JavaScriptHandler.instance()._parse_jest_results(Path('.'), subprocess.CompletedProcess([], 1, stdout, ''))
+    assert (result['tests_run'], result['tests_passed'], result['tests_failed']) == (3, 2, 1)
+    assert result['failures'] == [{'test_name': 'add negative', 'error': 'expected -1'}]
+
+
+SUREFIRE_REPORT = '''<?xml version="1.0" encoding="UTF-8"?>
+<testsuite name="com.example.CalculatorTest" tests="3" failures="1" errors="1" skipped="0">
+  <testcase name="testAdd" classname="com.example.CalculatorTest" time="0.001"/>
+  <testcase name="testSubtract" classname="com.example.CalculatorTest" time="0.002">
+    <failure message="expected:&lt;1&gt; but was:&lt;2&gt;" type="org.opentest4j.AssertionFailedError">stack</failure>
+  </testcase>
+  <testcase name="testDivide" classname="com.example.CalculatorTest" time="0.001">
+    <error type="java.lang.ArithmeticException">/ by zero</error>
+  </testcase>
+</testsuite>'''
+
+
+def test_parse_surefire_reports(tmp_path):
+    reports = tmp_path / 'target' / 'surefire-reports'
+    reports.mkdir(parents=True)
+    (reports / 'TEST-com.example.CalculatorTest.xml').write_text(SUREFIRE_REPORT)
+    #stdout summaries are ignored while the XML reports exist
+    result = JavaHandler.instance()._parse_maven_results(
+        tmp_path, subprocess.CompletedProcess([], 1, 'Tests run: 99, Failures: 0, Errors: 0, Skipped: 0', ''))
+    assert (result['tests_run'], result['tests_passed'], result['tests_failed']) == (3, 1, 2)
+    assert result['failures'] == [
+        {'test_name': 'com.example.CalculatorTest.testSubtract', 'error': 'expected:<1> but was:<2>'},
+        {'test_name': 'com.example.CalculatorTest.testDivide', 'error': '/ by zero'},
+    ]
+
+
+MAVEN_SUMMARY_LOG = '''[INFO] Running com.example.ATest
+[ERROR] Tests run: 3, Failures: 1, Errors: 0, Skipped: 0, Time elapsed: 0.05 s <<< FAILURE! - in com.example.ATest
+[INFO] Results:
+[ERROR] Tests run: 3, Failures: 1, Errors: 0, Skipped: 0
+[INFO] Running com.example.BTest
+[INFO] Tests run: 4, Failures: 0, Errors: 1, Skipped: 1, Time elapsed: 0.02 s - in com.example.BTest
+[INFO] Tests run: 4, Failures: 0, Errors: 1, Skipped: 1
+[INFO] BUILD FAILURE'''
+
+
+def test_parse_maven_summary_without_reports(tmp_path):
+    #no surefire-reports directory - each module's summary is summed, per-class lines are not counted again
+    result = JavaHandler.instance()._parse_maven_results(tmp_path, subprocess.CompletedProcess([], 1, MAVEN_SUMMARY_LOG, ''))
+    assert (result['tests_run'], result['tests_passed'], result['tests_failed']) == (7, 5, 2)
+
+
+def test_strip_code_fences():
+    from node_3.executor import _PYTHON_FENCE_RE, _PYTHON_FENCE_TAGS, _strip_code_fences
+    
+    def strip(code):
+        return _strip_code_fences(code, _PYTHON_FENCE_TAGS, _PYTHON_FENCE_RE)
+    
+    assert strip('```python\nx = 1\n```') == 'x = 1\n'
+    assert strip('```\nx = 1\n```') == 'x = 1\n'
+    assert strip('x = 1\ny = "``"') == 'x = 1\ny = "``"'
+    #a fenced block inside prose goes through the regex
+    assert strip('Here you go:\n```python\nx = 1\n```\n').strip() == 'Here you go:\nx = 1'
+
+
+def test_keyword_module_name_gets_plain_package(tmp_path):
+    from node_3.executor import PythonHandler
+    #`from . import class` would be a SyntaxError when the package is imported
+    PythonHandler.instance().write_source_file(tmp_path, SOURCE, 'class.py')
+    assert (tmp_path / '__init__.py').read_text() == ''
+    
+    PythonHandler.instance().write_source_file(tmp_path, SOURCE, 'calculator.py')
+    compile((tmp_path / '__init__.py').read_text(), '__init__.py', 'exec')